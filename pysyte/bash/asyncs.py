@@ -0,0 +1,152 @@
+"""Run bash commands concurrently, with asyncio
+
+Commands are set up when called, not when awaited
+    so each uses the working dir (from shell.cd() or shell.pushd()) of its call
+    e.g. to check many repos at once:
+
+    >>> import asyncio
+    >>> from pysyte.bash import shell
+    >>> commands = []
+    >>> for repo in ('/usr', '/usr/local'):
+    ...     with shell.pushd(repo):
+    ...         commands.append(arun('basename $PWD'))
+    >>> asyncio.run(gather(commands))
+    ['usr', 'local']
+"""
+
+import asyncio
+import os
+import signal
+from asyncio.subprocess import DEVNULL
+from asyncio.subprocess import PIPE
+from asyncio.subprocess import STDOUT
+from typing import AsyncIterator
+from typing import Awaitable
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+
+from pysyte.bash import shell
+from pysyte.bash.shell import BashError
+
+LIMIT = 8  # commands running at once
+
+Result = Union[str, BaseException]  # errors are results with return_exceptions
+
+
+class BashTimeout(BashError):
+    pass
+
+
+def _output(data: bytes) -> str:
+    """Decode data as subprocess.getstatusoutput() would"""
+    output = data.decode(errors="replace")
+    return output[:-1] if output.endswith("\n") else output
+
+
+async def _start(run_command: str) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_shell(
+        run_command, stdin=DEVNULL, stdout=PIPE, stderr=STDOUT, start_new_session=True
+    )
+
+
+async def _stop(process: asyncio.subprocess.Process) -> None:
+    """Kill the shell, and anything it started, if still running"""
+    if process.returncode is None:
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+async def _arun(run_command: str, timeout: Optional[float]) -> str:
+    process = await _start(run_command)
+    try:
+        data, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except asyncio.TimeoutError:
+        raise BashTimeout(f"{run_command}\nTimed out after {timeout}s")
+    finally:
+        await _stop(process)
+    output = _output(data)
+    if process.returncode:
+        raise BashError(f"{run_command}\n{output}")
+    return output
+
+
+def arun(command: str, timeout: Optional[float] = None) -> Awaitable[str]:
+    """Output of that command, when awaited, as from shell.run()
+
+    Raises BashError if the command fails
+        or BashTimeout if it takes more than timeout seconds
+    """
+    run_command = shell._run_command(shell._path_command(command))
+    return _arun(run_command, timeout)
+
+
+async def gather(
+    commands: Iterable[Awaitable[str]],
+    limit: int = LIMIT,
+    return_exceptions: bool = False,
+) -> List[Result]:
+    """Outputs of those commands (from arun()), in order
+
+    At most limit commands are running at once
+    With return_exceptions, errors are given as results, not raised
+    """
+    running = asyncio.Semaphore(limit)
+
+    async def limited(command: Awaitable[str]) -> str:
+        async with running:
+            return await command
+
+    awaiting = [limited(_) for _ in commands]
+    return await asyncio.gather(*awaiting, return_exceptions=return_exceptions)
+
+
+def run_all(
+    commands: Iterable[str],
+    limit: int = LIMIT,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> List[Result]:
+    """Outputs of those commands, run concurrently
+
+    >>> run_all(['echo fred', 'echo mary'])
+    ['fred', 'mary']
+    """
+    awaiting = [arun(_, timeout) for _ in commands]
+    return asyncio.run(gather(awaiting, limit, return_exceptions))
+
+
+async def _alines(run_command: str, timeout: Optional[float]) -> AsyncIterator[str]:
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + timeout
+    process = await _start(run_command)
+    assert process.stdout
+    try:
+        while True:
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                line = await asyncio.wait_for(process.stdout.readline(), remaining)
+            except asyncio.TimeoutError:
+                raise BashTimeout(f"{run_command}\nTimed out after {timeout}s")
+            if not line:
+                break
+            yield _output(line)
+        status = await process.wait()
+    finally:
+        await _stop(process)
+    if status:
+        raise BashError(f"{run_command}\nExited with status {status}")
+
+
+def alines(command: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+    """Lines of output from that command, as each is written
+
+    Raises BashError after the last line if the command fails
+        or BashTimeout if it takes more than timeout seconds in all
+    """
+    run_command = shell._run_command(shell._path_command(command))
+    return _alines(run_command, timeout)
@@ -1,22 +1,32 @@
 import os
 import atexit
+import sys
 
-from pysyte.bash.shell import run
+from pysyte import term
 
 _alt_screen_started = False
 
 _TERM = "xterm"
 
 
+def _tput(name, term_=""):
+    """Write that terminal capability, as tput would"""
+    stream = sys.__stdout__
+    if stream is None or not stream.isatty():
+        return
+    stream.flush()
+    os.write(stream.fileno(), term.capability(name, term_))
+
+
 def _stop_alt_screen():
     if _alt_screen_started:
-        run(f"TERM={_TERM} tput rmcup")
+        _tput("rmcup", _TERM)
 
 
 def _start_alt_screen():
     global _alt_screen_started
     _alt_screen_started = True
-    run("tput smcup")
+    _tput("smcup")
 
 
 def get_alt_screens():
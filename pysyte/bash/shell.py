@@ -1,12 +1,16 @@
 """Handle bash commands for pysyte"""
 
+import atexit
 import os
 from contextlib import contextmanager
 from subprocess import getstatusoutput
 from typing import List
+from typing import Optional
 
 from boltons.setutils import IndexedSet
 
+from pysyte.bash import workers
+
 
 class BashError(ValueError):
     pass
@@ -14,6 +18,7 @@ class BashError(ValueError):
 
 _working_dirs: List[str] = [""]
 _paths: List[str] = []
+_workers: List[workers.Workers] = []
 
 
 def cd(path: str):
@@ -42,13 +47,44 @@ def _get_path() -> str:
     return _paths[0]
 
 
-def run(command: str) -> str:
-    path_command = f"PATH={_get_path()} {command}"
+def use_workers(size: int = 4, timeout: Optional[float] = None) -> None:
+    """Run commands on a pool of (at most) that many shell workers
+
+    Commands which take more than timeout seconds are killed, and fail
+    With size 0, or without /bin/sh, each command is run in a new shell
+        which is the default
+    """
+    stop_workers()
+    if size and workers.sh():
+        _workers.append(workers.Workers(size, timeout=timeout))
+
+
+@atexit.register
+def stop_workers() -> None:
+    for pool in _workers:
+        pool.close()
+    _workers.clear()
+
+
+def _path_command(command: str) -> str:
+    return f"PATH={_get_path()} {command}"
+
+
+def _run_command(path_command: str) -> str:
+    """That command as it would be run in the current working dir"""
     if _working_dirs[0]:
-        run_command = f"(cd {_working_dirs[0]}; {path_command})"
+        return f"(cd {_working_dirs[0]}; {path_command})"
+    return path_command
+
+
+def run(command: str) -> str:
+    path_command = _path_command(command)
+    working_dir = _working_dirs[0]
+    run_command = _run_command(path_command)
+    if _workers:
+        status, output = _workers[0].run(path_command, working_dir or os.getcwd())
     else:
-        run_command = path_command
-    status, output = getstatusoutput(run_command)
+        status, output = getstatusoutput(run_command)
     if status:
         raise BashError(f"{run_command}\n{output}")
     return output
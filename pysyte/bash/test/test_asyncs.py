@@ -0,0 +1,68 @@
+"""Test the asyncs module"""
+
+import asyncio
+import time
+import unittest
+
+from pysyte.bash import asyncs
+from pysyte.bash import shell
+
+
+class TestAsyncs(unittest.TestCase):
+    def test_arun(self):
+        """Output is as from shell.run()"""
+        self.assertEqual(asyncio.run(asyncs.arun("printf fred")), "fred")
+        self.assertEqual(asyncio.run(asyncs.arun("echo fred")), shell.run("echo fred"))
+
+    def test_errors(self):
+        """Failed commands raise BashError, with their output"""
+        with self.assertRaises(shell.BashError) as context:
+            asyncio.run(asyncs.arun("echo fred >&2; exit 3"))
+        self.assertTrue(str(context.exception).endswith("\nfred"))
+
+    def test_timeout(self):
+        """Slow commands are stopped"""
+        with self.assertRaises(asyncs.BashTimeout):
+            asyncio.run(asyncs.arun("sleep 5", timeout=0.1))
+
+    def test_concurrent(self):
+        """Commands run at the same time, up to the limit"""
+        start = time.perf_counter()
+        outputs = asyncs.run_all([f"sleep 0.2; echo {i}" for i in range(4)])
+        self.assertEqual(outputs, ["0", "1", "2", "3"])
+        self.assertLess(time.perf_counter() - start, 0.6)
+        start = time.perf_counter()
+        asyncs.run_all(["sleep 0.1"] * 3, limit=1)
+        self.assertGreater(time.perf_counter() - start, 0.3)
+
+    def test_return_exceptions(self):
+        outputs = asyncs.run_all(["echo fred", "exit 1"], return_exceptions=True)
+        self.assertEqual(outputs[0], "fred")
+        self.assertIsInstance(outputs[1], shell.BashError)
+
+    def test_pushd(self):
+        """Commands run where they were called, not where they are awaited"""
+        with shell.pushd("/usr"):
+            command = asyncs.arun("pwd")
+        self.assertEqual(asyncio.run(command), "/usr")
+
+    def test_alines(self):
+        """Lines are given as they are written"""
+
+        async def lines(command):
+            return [_ async for _ in asyncs.alines(command)]
+
+        async def lines_within(command, timeout):
+            return [_ async for _ in asyncs.alines(command, timeout)]
+
+        self.assertEqual(asyncio.run(lines("echo fred; echo mary")), ["fred", "mary"])
+        with self.assertRaises(shell.BashError):
+            asyncio.run(lines("echo fred; exit 2"))
+
+        async def first_line(command):
+            async for line in asyncs.alines(command, timeout=0.1):
+                return line
+
+        self.assertEqual(asyncio.run(first_line("echo fred; sleep 5")), "fred")
+        with self.assertRaises(asyncs.BashTimeout):
+            asyncio.run(lines_within("sleep 5", 0.1))
@@ -1,8 +1,6 @@
 from unittest import TestCase
 from unittest.mock import patch
 
-from callee import Contains
-
 from pysyte.bash import screen
 
 starting_callbacks = screen.atexit._ncallbacks()
@@ -28,27 +26,27 @@ class TestScreen(TestCase):
         actual = screen.get_alt_screens()
         self.assertEqual(actual, expected)
 
-    @patch("pysyte.bash.screen.run")
-    def test_start_alt_screen(self, run):
-        """start_alt_screen should run the tput command smcup"""
+    @patch("pysyte.bash.screen._tput")
+    def test_start_alt_screen(self, tput):
+        """start_alt_screen should write the capability smcup"""
         start_alt_screen, _ = screen.get_alt_screens()
         start_alt_screen()
-        run.assert_called_with("tput smcup")
+        tput.assert_called_with("smcup")
 
-    @patch("pysyte.bash.screen.run")
-    def test_not_stop_alt_screen(self, run):
-        """stop_alt_screen will run "tput rmcup" if start_alt_screen() was run
+    @patch("pysyte.bash.screen._tput")
+    def test_not_stop_alt_screen(self, tput):
+        """stop_alt_screen will write "rmcup" if start_alt_screen() was run
 
         These tests do not actually run start_alt_screen()
             So stop_alt_screen() should do nothing
         """
         _, stop_alt_screen = screen.get_alt_screens()
         stop_alt_screen()
-        run.assert_not_called()
+        tput.assert_not_called()
 
-    @patch("pysyte.bash.screen.run")
-    def test_stop_alt_screen(self, run):
-        """stop_alt_screen should run the tput command rmcup
+    @patch("pysyte.bash.screen._tput")
+    def test_stop_alt_screen(self, tput):
+        """stop_alt_screen should write the capability rmcup
 
         it will only run that command if the start_alt_screen() was run first
             These tests do not actually run that
@@ -61,4 +59,4 @@ class TestScreen(TestCase):
             stop_alt_screen()
         finally:
             screen._alt_screen_started = safe
-        run.assert_called_with(Contains("tput rmcup"))
+        tput.assert_called_with("rmcup", screen._TERM)
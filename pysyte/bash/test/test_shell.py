@@ -1,10 +1,14 @@
 """Test the term module"""
 
 
+import os
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from subprocess import getstatusoutput
 
 
 from pysyte.bash import shell
+from pysyte.bash import workers
 
 
 class TestShell(unittest.TestCase):
@@ -18,3 +22,102 @@ class TestShell(unittest.TestCase):
         shell.cd("/usr/local")
         actual = shell.run("basename $PWD")
         self.assertEqual(actual, expected)
+
+    def test_workers(self):
+        """Commands are run in the same shell, which outlives them"""
+        shell.use_workers(1)
+        try:
+            first = shell.run("echo $PPID")
+            shell.run("exit 0")
+            self.assertEqual(shell.run("echo $PPID"), first)
+        finally:
+            shell.stop_workers()
+
+    def test_without_workers(self):
+        """Without workers, each command has its own shell"""
+        shell.stop_workers()
+        self.assertEqual(shell.run("printf fred"), "fred")
+        with self.assertRaises(shell.BashError):
+            shell.run("exit 3")
+
+    def test_workers_as_sh(self):
+        """Commands are run by sh, as they would be without workers"""
+        commands = ["echo $0", "echo -e fred"]
+        expected = [getstatusoutput(_) for _ in commands]
+        shell.use_workers(1)
+        try:
+            pool = shell._workers[0]
+            self.assertEqual([pool.run(_) for _ in commands], expected)
+        finally:
+            shell.stop_workers()
+
+    def test_workers_unbalanced(self):
+        """A command which cannot be parsed fails, and does not stop its worker"""
+        shell.use_workers(1)
+        try:
+            with self.assertRaises(shell.BashError):
+                shell.run("echo 'oops")
+            self.assertEqual(shell.run("echo fred"), "fred")
+        finally:
+            shell.stop_workers()
+
+    def test_workers_environ(self):
+        """Workers see changes to os.environ"""
+        shell.use_workers(1)
+        try:
+            self.assertEqual(shell.run("echo $PYSYTE_FRED"), "")
+            os.environ["PYSYTE_FRED"] = "bar"
+            self.assertEqual(shell.run("echo $PYSYTE_FRED"), "bar")
+        finally:
+            os.environ.pop("PYSYTE_FRED", None)
+            shell.stop_workers()
+
+    def test_workers_timeout(self):
+        """Commands which take too long fail, and their worker is replaced"""
+        shell.use_workers(1, timeout=0.2)
+        try:
+            with self.assertRaises(shell.BashError):
+                shell.run("sleep 5")
+            self.assertEqual(shell.run("echo fred"), "fred")
+        finally:
+            shell.stop_workers()
+
+
+class TestWorkers(unittest.TestCase):
+    def setUp(self):
+        self.workers = workers.Workers(2)
+
+    def tearDown(self):
+        self.workers.close()
+
+    def test_output(self):
+        """Output and status are as from subprocess.getstatusoutput()"""
+        self.assertEqual(self.workers.run("printf 'fred\\n\\n'"), (0, "fred\n"))
+        self.assertEqual(self.workers.run("printf fred"), (0, "fred"))
+        self.assertEqual(self.workers.run("echo fred >&2; exit 3"), (3, "fred"))
+
+    def test_working_dir(self):
+        """Workers cd only when asked, and commands cannot move them"""
+        self.assertEqual(self.workers.run("pwd", "/usr"), (0, "/usr"))
+        self.assertEqual(self.workers.run("cd /; pwd"), (0, "/"))
+        self.assertEqual(self.workers.run("pwd"), (0, "/usr"))
+
+    def test_stdin(self):
+        """Commands cannot read the worker's own input"""
+        self.assertEqual(self.workers.run("cat"), (0, ""))
+        self.assertEqual(self.workers.run("echo fred"), (0, "fred"))
+
+    def test_dead_worker(self):
+        """A worker which is killed fails its command, and is replaced"""
+        status, _ = self.workers.run("kill -9 $$")
+        self.assertTrue(status)
+        self.assertFalse(self.workers.idle)
+        self.assertEqual(self.workers.run("echo fred"), (0, "fred"))
+
+    def test_threads(self):
+        """Concurrent callers each have a worker, up to the pool's size"""
+        with ThreadPoolExecutor(4) as executor:
+            outputs = list(executor.map(self.workers.run, ["echo $$"] * 8))
+        self.assertTrue(all(status == 0 for status, _ in outputs))
+        self.assertLessEqual(len({output for _, output in outputs}), 2)
+        self.assertLessEqual(len(self.workers.idle), 2)
@@ -0,0 +1,217 @@
+"""Run shell commands in long-lived shell processes
+
+Starting a shell for each command costs a fork and an exec
+    which is most of the time taken by small commands
+A worker is one /bin/sh process (as getstatusoutput() uses), kept running
+    which reads commands on stdin, and writes their output
+    followed by a sentinel line with their status
+
+Commands are quoted, and eval'd in a subshell
+    so they cannot change the worker itself, nor hide its sentinel
+    but the worker keeps its working directory, changing it only when asked
+A worker has the environment it was started with
+    so is replaced when os.environ has changed since
+"""
+
+import os
+import select
+import shlex
+import signal
+import subprocess
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+StatusOutput = Tuple[int, str]
+
+SH = "/bin/sh"
+TIMED_OUT = 124  # status of a command which took too long, as from timeout(1)
+
+
+def sh() -> Optional[str]:
+    """Path to sh, if it is available"""
+    return SH if os.access(SH, os.X_OK) else None
+
+
+class Worker:
+    """One shell process, running one command at a time"""
+
+    def __init__(self, sh_: str = SH):
+        self.sentinel = f"__pysyte_{uuid.uuid4().hex}__"
+        self.environ: Dict[str, str] = dict(os.environ)
+        self.process = subprocess.Popen(
+            [sh_],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=self.environ,
+            start_new_session=True,
+        )
+        assert self.process.stdin and self.process.stdout
+        self.stdin = self.process.stdin
+        self.stdout = self.process.stdout
+        self.cwd = os.getcwd()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.process.pid}>"
+
+    @property
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    @property
+    def stale(self) -> bool:
+        """Whether os.environ has changed since the worker was started"""
+        return self.environ != dict(os.environ)
+
+    def _script(self, command: str, cwd: str) -> bytes:
+        lines = []
+        if cwd and cwd != self.cwd:
+            lines.append(f"cd -- {shlex.quote(cwd)}")
+            self.cwd = cwd
+        lines.append(f"( eval {shlex.quote(command)} ) </dev/null")
+        lines.append(f"printf '\\n%s %d\\n' {self.sentinel} $?")
+        return os.fsencode("\n".join(lines) + "\n")
+
+    def _read(self, timeout: Optional[float]) -> Tuple[Optional[int], bytes]:
+        """Status and output up to the sentinel
+
+        Status is None if the command timed out
+        """
+        marker = f"\n{self.sentinel} ".encode()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fd = self.stdout.fileno()
+        data, start = b"", 0
+        while True:
+            if deadline is not None:
+                remaining = max(0.0, deadline - time.monotonic())
+                readable, _, _ = select.select([fd], [], [], remaining)
+                if not readable:
+                    return None, data
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                return self.process.wait() or 1, data + b"\nshell worker has exited"
+            data += chunk
+            found = data.find(marker, start)
+            if found < 0:
+                start = max(0, len(data) - len(marker))
+                continue
+            start = found
+            end = data.find(b"\n", found + len(marker))
+            if end >= 0:
+                return int(data[found + len(marker) : end]), data[:found]
+
+    def run(
+        self, command: str, cwd: str = "", timeout: Optional[float] = None
+    ) -> StatusOutput:
+        """Status and output of that command, as from getstatusoutput()
+
+        The command is run in cwd, if given, else where the worker is
+        If the worker dies the status is non-zero
+        If the command takes more than timeout seconds the worker is killed
+            and the status is TIMED_OUT
+        """
+        try:
+            self.stdin.write(self._script(command, cwd))
+            self.stdin.flush()
+        except BrokenPipeError:
+            return 1, "shell worker has exited"
+        try:
+            status, data = self._read(timeout)
+        except BaseException:
+            self.kill()
+            raise
+        if status is None:
+            self.kill()
+            status = TIMED_OUT
+            data += f"\nTimed out after {timeout}s".encode()
+        output = os.fsdecode(data)
+        if output.endswith("\n"):
+            output = output[:-1]
+        return status, output
+
+    def kill(self) -> None:
+        """Stop the worker, and anything it started, now"""
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        self.close()
+
+    def close(self) -> None:
+        try:
+            self.stdin.close()
+        except BrokenPipeError:
+            pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
+        self.stdout.close()
+
+
+class Workers:
+    """A pool of at most size workers, each started when first needed
+
+    Callers in different threads each get their own worker
+        and wait for one when all are busy
+    Commands which take more than timeout seconds are killed
+    """
+
+    def __init__(
+        self, size: int = 1, sh_: Optional[str] = None, timeout: Optional[float] = None
+    ):
+        self.size = size
+        self.sh = sh_ or sh() or SH
+        self.timeout = timeout
+        self.idle: List[Worker] = []
+        self.lock = threading.Lock()
+        self.available = threading.BoundedSemaphore(size)
+        self.pid = os.getpid()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.idle)}/{self.size} idle>"
+
+    def _forked(self) -> None:
+        """Workers' pipes belong to the parent process, not to a forked child"""
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.idle = []
+
+    @contextmanager
+    def worker(self) -> Iterator[Worker]:
+        with self.available:
+            with self.lock:
+                self._forked()
+                worker = self.idle.pop() if self.idle else None
+            if worker and worker.stale:
+                worker.close()
+                worker = None
+            if worker is None:
+                worker = Worker(self.sh)
+            try:
+                yield worker
+            finally:
+                with self.lock:
+                    if worker.alive and self.pid == os.getpid():
+                        self.idle.append(worker)
+
+    def run(self, command: str, cwd: str = "") -> StatusOutput:
+        """Status and output of that command, from an idle worker"""
+        with self.worker() as worker:
+            return worker.run(command, cwd, self.timeout)
+
+    def close(self) -> None:
+        """Stop all idle workers"""
+        with self.lock:
+            self._forked()
+            idle, self.idle = self.idle, []
+        for worker in idle:
+            worker.close()
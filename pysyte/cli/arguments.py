@@ -14,12 +14,12 @@ from functools import partial
 from typing import Any
 from typing import List
 
-import stackprinter
-
+from pysyte.cli import config as cli_config
 from pysyte.cli.config import load_configs
+from pysyte.lazy import lazy_import
 from pysyte.types.numbers import inty
 
-from pysyte.cli.config import pysyte
+stackprinter = lazy_import("stackprinter")
 
 
 def config(arguments):
@@ -171,7 +171,7 @@ class ArgumentHandler:
         except SystemExit as e:
             return e.code
         except Exception as e:
-            stackprinter.show(e, style=pysyte.stackprinter.style)
+            stackprinter.show(e, style=cli_config.pysyte.stackprinter.style)
 
 
 def parser(description=None, usage=None, epilog=None):
@@ -1,14 +1,21 @@
 """Handle configs from program name"""
 
+from __future__ import annotations
+
 from typing import Optional
 from typing import List
+from typing import TYPE_CHECKING
 
 from pysyte import __file__ as path_to_pysyte
+from pysyte.lazy import lazy_import
 from pysyte.oss import linux
-from pysyte.config.types import ConfigPaths
-from pysyte.types.dictionaries import NameSpaces
-from pysyte.types.paths import DirectPath
-from pysyte.types.paths import path
+
+if TYPE_CHECKING:
+    from pysyte.types.dictionaries import NameSpaces
+    from pysyte.types.paths import DirectPath
+
+config_types = lazy_import("pysyte.config.types")
+paths = lazy_import("pysyte.types.paths")
 
 
 def _common_config_dirs(extras: List[DirectPath]) -> List[DirectPath]:
@@ -24,7 +31,7 @@ def _common_config_dirs(extras: List[DirectPath]) -> List[DirectPath]:
     """
 
     def add_dir(value: str):
-        path_ = path(value)
+        path_ = paths.path(value)
         if not path_:
             return
         expanded = path_.expand()
@@ -48,8 +55,14 @@ def _common_config_dirs(extras: List[DirectPath]) -> List[DirectPath]:
 
 def load_configs(name: str, extras: Optional[list] = None) -> NameSpaces:
     """Load all config files with that name from common config dirs"""
-    config_paths = ConfigPaths(_common_config_dirs(extras or []))
+    config_paths = config_types.ConfigPaths(_common_config_dirs(extras or []))
     return config_paths.load(name)
 
 
-pysyte = load_configs("pysyte", [path(path_to_pysyte)])
+def __getattr__(name: str) -> NameSpaces:
+    """Load pysyte's own configs when first needed, not on import"""
+    if name != "pysyte":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    configs = load_configs("pysyte", [paths.path(path_to_pysyte)])
+    globals()[name] = configs
+    return configs
@@ -1,12 +1,32 @@
+import sys
 from contextlib import contextmanager
 
-from rich.console import Console
-from rich.traceback import install
+from pysyte.lazy import lazy_import
 
-install(show_locals=True)
+rich_console = lazy_import("rich.console")
+rich_traceback = lazy_import("rich.traceback")
 
+_console = None
 
-_console = Console()
+
+def _rich_excepthook(*exc_info):
+    """Install rich's tracebacks, only when the first one is needed"""
+    rich_traceback.install(show_locals=True)
+    if sys.excepthook is _rich_excepthook:
+        sys.__excepthook__(*exc_info)
+    else:
+        sys.excepthook(*exc_info)
+
+
+sys.excepthook = _rich_excepthook
+
+
+def console():
+    """The console for exceptions, made when first needed"""
+    global _console
+    if _console is None:
+        _console = rich_console.Console()
+    return _console
 
 
 @contextmanager
@@ -16,4 +36,4 @@ def rich_exceptions(locals_: dict):
     try:
         yield
     except:  # noqa
-        _console.print_exception(show_locals=True)
+        console().print_exception(show_locals=True)
@@ -1,14 +1,17 @@
 """Any option mentioning "a line" means either a number or a regexp"""
 
 import sys
+from argparse import Namespace
 from collections import defaultdict
-from functools import partial
 from typing import DefaultDict
 from typing import List
 
 from pysyte import __version__
 from pysyte.cli.arguments import ArgumentsParser
 from pysyte.types import lines as pylines
+from pysyte.types.offsets import ENCODING
+from pysyte.types.offsets import ERRORS
+from pysyte.types.offsets import arg_file_lines
 from pysyte.bash.screen import alt_screen
 
 
@@ -67,11 +70,19 @@ class LinesParser(ArgumentsParser):
         [self.add_to(letter, *args) for letter, args in args.items()]
         return self
 
+    def add_jobs(self):
+        """Options to process many files at once"""
+        jobs = "number of files to process at once (default: one per CPU)"
+        self.add_to("j", "jobs", "files", "integer", jobs)
+        unordered = "show each file when it is done, not in order given"
+        self.add_to("u", "unordered", "files", "boolean", unordered)
+        return self
+
     def post_parser(self, args):
         if args.version and self.version:
             sys.stdout.write(f"{sys.argv[0]} version: {self.version}")
             raise SystemExit
-        args.sed = partial(pylines.sed, args=args)
+        args.sed = lambda lines, start=None: pylines.sed(lines, args, start)
         args.alt_screen = alt_screen()
         return args
 
@@ -83,5 +94,28 @@ def add_args(old_parser: ArgumentsParser) -> LinesParser:
     return result
 
 
+def line_options(args) -> Namespace:
+    """Copy the line options from those args, to send to other processes"""
+    names = ("at", "first", "last", "numbers", "width")
+    return Namespace(**{_: args.get_arg(_) for _ in names})
+
+
+def chop_file(options: Namespace, path_: str) -> str:
+    """Text of the lines chosen by those options from that file"""
+    chopped = arg_file_lines(path_, options)
+    if chopped:
+        start, lines_in = chopped
+        return pylines.as_text(pylines.sed(lines_in, options, start))
+    with open(path_, encoding=ENCODING, errors=ERRORS) as stream:
+        start, lines_in = pylines.arg_stream_lines(stream, options)
+        return pylines.as_text(pylines.sed(lines_in, options, start))
+
+
+def grep_file(grep: pylines.Grep, path_: str) -> str:
+    """Text of the lines selected by that grep from that file"""
+    with open(path_, encoding=ENCODING, errors=ERRORS) as stream:
+        return pylines.as_text(grep(_.rstrip("\n") for _ in stream))
+
+
 def arg_lines(a, b):
     raise NotImplementedError
@@ -12,10 +12,12 @@ from typing import Optional
 from pysyte.cli import arguments
 from pysyte.cli import app
 from pysyte.cli.config import load_configs
-from pysyte.types.paths import makepath
+from pysyte.lazy import lazy_import
 from pysyte.types.methods import Callable
 from pysyte.types.methods import Method
 
+paths = lazy_import("pysyte.types.paths")
+
 
 class MainMethod(Method):
     def __init__(self, method):
@@ -91,8 +93,8 @@ def run(
 
         def config_name(self, name):
             if not isinstance(name, str):
-                return makepath(self.method).name
-            p = makepath(name)
+                return paths.makepath(self.method).name
+            p = paths.makepath(name)
             return p.name if p else name
 
         def config(self):
@@ -0,0 +1,96 @@
+"""Process many files on a pool of workers
+
+Results for each file are given in the order the files were given
+    or as soon as each is ready, if unordered
+Only a few files per worker are in hand at any time
+    so memory is bounded by the number of workers, not of files
+
+Methods are sent to worker processes, so should be defined in a module
+    (not in a script), and take plain arguments, e.g. via functools.partial()
+"""
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import Executor
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import wait
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import Tuple
+
+Processed = Iterator[Tuple[str, Any]]  # (path, result) pairs
+
+
+def default_workers() -> int:
+    """One worker per CPU"""
+    return os.cpu_count() or 1
+
+
+def _ordered(executor: Executor, method, paths: Iterator[str], pending: int):
+    def submit(path_: str) -> Tuple[str, Future]:
+        return path_, executor.submit(method, path_)
+
+    waiting: Deque[Tuple[str, Future]] = deque(
+        submit(_) for _ in itertools.islice(paths, pending)
+    )
+    while waiting:
+        path_, future = waiting.popleft()
+        result = future.result()
+        waiting.extend(submit(_) for _ in itertools.islice(paths, 1))
+        yield path_, result
+
+
+def _unordered(executor: Executor, method, paths: Iterator[str], pending: int):
+    waiting: Dict[Future, str] = {}
+
+    def submit(some_paths: Iterable[str]) -> None:
+        for path_ in some_paths:
+            waiting[executor.submit(method, path_)] = path_
+
+    submit(itertools.islice(paths, pending))
+    while waiting:
+        done, _ = wait(waiting, return_when=FIRST_COMPLETED)
+        for future in done:
+            path_ = waiting.pop(future)
+            submit(itertools.islice(paths, 1))
+            yield path_, future.result()
+
+
+def process(
+    method: Callable[[str], Any],
+    paths: Iterable[str],
+    workers: int = 0,
+    ordered: bool = True,
+    max_pending: int = 0,
+    executor_class: Callable[[int], Executor] = ProcessPoolExecutor,
+) -> Processed:
+    """Each path, with the result of method(path), from a pool of workers
+
+    workers defaults to one per CPU, but is no more than the number of paths
+        and with only one the pool is not used
+    At most max_pending paths are sent to workers ahead of the caller
+        which defaults to twice the number of workers
+
+    Any error from method is raised here, and no more paths are started
+    """
+    paths_: Iterator[str] = iter(str(_) for _ in paths)
+    first = list(itertools.islice(paths_, workers or default_workers()))
+    workers_ = len(first)
+    paths_ = itertools.chain(first, paths_)
+    if workers_ < 2:
+        yield from ((_, method(_)) for _ in paths_)
+        return
+    pending = max_pending or 2 * workers_
+    executor = executor_class(workers_)
+    processor = _ordered if ordered else _unordered
+    try:
+        yield from processor(executor, method, paths_, pending)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -3,11 +3,9 @@
 import os
 import sys
 
-from six import StringIO
-
 from pysyte import iteration
 from pysyte.cli import arguments
-from pysyte.oss.platforms import get_clipboard_data
+from pysyte.oss import platforms
 
 
 def parse_args(description=""):
@@ -23,7 +21,7 @@ def args(parsed_args, name="streams", files_only=False):
     """Interpret parsed args to streams"""
     streams = []
     strings = parsed_args.get_strings(name)
-    files = [s for s in strings if os.path.isfile(s)]
+    files = paths(parsed_args, name)
     if files:
         streams = [open(f) for f in files]
     if strings or files_only:
@@ -35,6 +33,11 @@ def args(parsed_args, name="streams", files_only=False):
     return streams
 
 
+def paths(parsed_args, name="streams"):
+    """Paths to the files named in parsed args"""
+    return [s for s in parsed_args.get_strings(name) if os.path.isfile(s)]
+
+
 def files(parsed_args, name=None):
     return args(parsed_args, name, True)
 
@@ -56,9 +59,7 @@ def some():
 
 
 def clipboard_stream(name=None):
-    stream = StringIO(get_clipboard_data())
-    stream.name = name or "<clipboard>"
-    return stream
+    return platforms.clipboard_stream(name or "<clipboard>")
 
 
 def _arg_files():
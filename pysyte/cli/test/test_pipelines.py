@@ -0,0 +1,86 @@
+"""Test the pipelines module"""
+
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from pysyte.cli import pipelines
+
+
+class TestProcess(unittest.TestCase):
+    def setUp(self):
+        self.paths = [f"/path/to/{i}" for i in range(20)]
+        self.started = []
+        self.lock = threading.Lock()
+
+    def slow_name(self, path_):
+        """Later paths are quicker, so would finish first"""
+        with self.lock:
+            self.started.append(path_)
+        time.sleep((20 - int(os.path.basename(path_))) / 1000)
+        return os.path.basename(path_)
+
+    def process(self, **kwargs):
+        kwargs.setdefault("workers", 4)
+        kwargs.setdefault("executor_class", ThreadPoolExecutor)
+        return pipelines.process(self.slow_name, self.paths, **kwargs)
+
+    def test_ordered(self):
+        """Results are given in the order of the paths"""
+        actual = list(self.process())
+        expected = [(_, os.path.basename(_)) for _ in self.paths]
+        self.assertEqual(actual, expected)
+
+    def test_unordered(self):
+        """Unordered results have all the paths, as they finish"""
+        actual = list(self.process(ordered=False))
+        self.assertCountEqual(actual, [(_, os.path.basename(_)) for _ in self.paths])
+
+    def test_bounded(self):
+        """No more than max_pending paths are started ahead of the caller"""
+        processed = self.process(max_pending=3)
+        next(processed)
+        time.sleep(0.05)
+        self.assertLessEqual(len(self.started), 4)
+        processed.close()
+
+    def test_one_worker(self):
+        """With one worker, paths are processed in this thread"""
+        processed = self.process(workers=1)
+        self.assertEqual(next(processed), (self.paths[0], "0"))
+        self.assertEqual(self.started, self.paths[:1])
+
+    def test_errors(self):
+        """Errors from workers are raised to the caller"""
+
+        def fail(path_):
+            raise ValueError(path_)
+
+        processed = pipelines.process(
+            fail, self.paths, workers=2, executor_class=ThreadPoolExecutor
+        )
+        with self.assertRaises(ValueError):
+            list(processed)
+
+    def test_processes(self):
+        """By default, paths are processed by a pool of processes"""
+        actual = list(pipelines.process(os.path.basename, self.paths, workers=2))
+        self.assertEqual(actual, [(_, os.path.basename(_)) for _ in self.paths])
+
+    def test_few_paths(self):
+        """No more workers are started than there are paths"""
+        sizes = []
+
+        def executor_class(workers):
+            sizes.append(workers)
+            return ThreadPoolExecutor(workers)
+
+        paths = self.paths[:3]
+        for paths_ in (paths[:1], paths):
+            processed = pipelines.process(
+                self.slow_name, paths_, workers=8, executor_class=executor_class
+            )
+            self.assertEqual([path_ for path_, _ in processed], paths_)
+        self.assertEqual(sizes, [3])
@@ -0,0 +1,6 @@
+from pysyte.lazy import submodule
+
+
+def __getattr__(name):
+    """Import submodules when first used as attributes of this package"""
+    return submodule(__name__, name)
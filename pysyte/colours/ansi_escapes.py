@@ -2,8 +2,20 @@
 
 All numbers used in this file are values usable in an ANSI escape sequence
     See http://en.wikipedia.org/wiki/ANSI_escape_code for values
+
+Escapes for all 256 colours, and for styles, are made once, into tables
+Many spans of coloured text can be rendered at once
+    which only resets colours where they change
 """
 
+from typing import Iterable
+from typing import Iterator
+from typing import Optional
+from typing import TextIO
+from typing import Tuple
+
+Span = Tuple[str, Optional[int], Optional[int]]  # text, foreground, background
+
 
 def escape(string):
     return f"\033{string}"
@@ -13,20 +25,25 @@ def escape_sequence(string):
     return escape(f"[{string}m")
 
 
+BOLD = escape_sequence("1")
+NO_BOLD = escape_sequence("22")
+NO_COLOUR = escape_sequence("2") + escape_sequence("0")
+
+
 def bold():
-    return escape_sequence("1")
+    return BOLD
 
 
 def no_bold():
-    return escape_sequence("22")
+    return NO_BOLD
 
 
 def no_colour():
-    return escape_sequence("2") + escape_sequence("0")
+    return NO_COLOUR
 
 
 def no_prompt():
-    return prompt(no_colour())
+    return NO_PROMPT
 
 
 def _colour_16(ground, i):
@@ -63,22 +80,43 @@ def _small_colour_number(i):
     return i < 16
 
 
+def _foreground(i):
+    return _small_colour_number(i) and _foreground_16(i) or _foreground_256(i)
+
+
+def _background(i):
+    return _small_colour_number(i) and _background_16(i) or _background_256(i)
+
+
+foregrounds = {i: _foreground(i) for i in range(1, 256)}
+backgrounds = {i: _background(i) for i in range(1, 256)}
+
+
 def foreground(i):
     if not i:
         return ""
-    return _small_colour_number(i) and _foreground_16(i) or _foreground_256(i)
+    try:
+        return foregrounds[i]
+    except KeyError:
+        return _foreground(i)
 
 
 def background(i):
     if not i:
         return ""
-    return _small_colour_number(i) and _background_16(i) or _background_256(i)
+    try:
+        return backgrounds[i]
+    except KeyError:
+        return _background(i)
 
 
 def prompt(string):
     return f"\001{string}\002"
 
 
+NO_PROMPT = prompt(NO_COLOUR)
+
+
 def colour_string(colour, text):
     stop = no_colour() if colour else ""
     return f"{colour}{text}{stop}"
@@ -104,3 +142,37 @@ def grounds_string(text, background_colour, foreground_colour):
 def prompt_string(text, i):
     string = foreground(i)
     return f"{prompt(string)}{text}{no_prompt()}"
+
+
+def _rendered(spans: Iterable[Span]) -> Iterator[str]:
+    coloured = None
+    for text, foreground_colour, background_colour in spans:
+        colours = (foreground_colour or None, background_colour or None)
+        if colours != coloured:
+            if coloured:
+                yield NO_COLOUR
+            if any(colours):
+                yield background(background_colour)
+                yield foreground(foreground_colour)
+            coloured = colours if any(colours) else None
+        yield text
+    if coloured:
+        yield NO_COLOUR
+
+
+def render(spans: Iterable[Span]) -> str:
+    """A string of those spans of (text, foreground, background)
+
+    Colours are only reset where they change
+        so it looks the same as each span from grounds_string(), but is shorter
+
+    >>> spans = [('a', 1, None), ('b', 1, 0), ('c', None, 4), ('d', None, None)]
+    >>> render(spans) == f'{foreground(1)}ab{NO_COLOUR}{background(4)}c{NO_COLOUR}d'
+    True
+    """
+    return "".join(_rendered(spans))
+
+
+def write(spans: Iterable[Span], stream: TextIO) -> None:
+    """Write those spans of (text, foreground, background) to that stream"""
+    stream.writelines(_rendered(spans))
@@ -14,7 +14,11 @@ Methods handle two known representations:
 import re
 
 
-from pysyte.colours import colour_names
+from pysyte.lazy import lazy_import
+
+colour_tables = lazy_import("pysyte.colours.colour_tables")
+
+_hex = re.compile("(([0-9a-f]{6})|([0-9a-f]{3}))", re.IGNORECASE)
 
 
 def integer_to_ansi(integer):
@@ -66,13 +70,13 @@ def red_green_blue_to_int(red, green, blue):
 
 
 def _hex_regexp():
-    return re.compile("(([0-9a-f]{6})|([0-9a-f]{3}))", re.IGNORECASE)
+    return _hex
 
 
 def _extract_html_hex(string):
     """Get the first 3 or 6 hex digits in the string"""
     try:
-        hex_string = string and _hex_regexp().search(string).group(0) or ""
+        hex_string = string and _hex.search(string).group(0) or ""
     except AttributeError:
         return None
     if len(hex_string) == 3:
@@ -112,7 +116,7 @@ def integer_to_html(integer):
     return "#%06X" % integer
 
 
-def html_to_ansi(string):
+def _html_to_ansi(string):
     i = html_to_small_ansi(string)
     if i is not None:
         return i
@@ -120,7 +124,18 @@ def html_to_ansi(string):
     return integer_to_ansi(i)
 
 
-def ansi_to_int(ansi):
+def html_to_ansi(string):
+    try:
+        return colour_tables.html_ansis[string]
+    except KeyError:
+        pass
+    ansi = _html_to_ansi(string)
+    if len(colour_tables.html_ansis) < colour_tables.MAX_HTMLS:
+        colour_tables.html_ansis[string] = ansi
+    return ansi
+
+
+def _ansi_to_int(ansi):
     if ansi <= 16:
         return ansi
     elif ansi > 231:
@@ -131,25 +146,34 @@ def ansi_to_int(ansi):
     return red_green_blue_to_int(r, g, b)
 
 
+def ansi_to_int(ansi):
+    if 0 <= ansi < 256:
+        return colour_tables.ansi_ints[ansi]
+    return _ansi_to_int(ansi)
+
+
+_small_values = (
+    (0x00, "#000000"),
+    (0x01, "#800000"),
+    (0x02, "#008000"),
+    (0x03, "#808000"),
+    (0x04, "#000080"),
+    (0x05, "#800080"),
+    (0x06, "#008080"),
+    (0x07, "#C0C0C0"),
+    (0x08, "#808080"),
+    (0x09, "#FF0000"),
+    (0x0A, "#00FF00"),
+    (0x0B, "#FFFF00"),
+    (0x0C, "#0000FF"),
+    (0x0D, "#FF00FF"),
+    (0x0E, "#00FFFF"),
+    (0x0F, "#000000"),
+)
+
+
 def small_values():
-    return [
-        (0x00, "#000000"),
-        (0x01, "#800000"),
-        (0x02, "#008000"),
-        (0x03, "#808000"),
-        (0x04, "#000080"),
-        (0x05, "#800080"),
-        (0x06, "#008080"),
-        (0x07, "#C0C0C0"),
-        (0x08, "#808080"),
-        (0x09, "#FF0000"),
-        (0x0A, "#00FF00"),
-        (0x0B, "#FFFF00"),
-        (0x0C, "#0000FF"),
-        (0x0D, "#FF00FF"),
-        (0x0E, "#00FFFF"),
-        (0x0F, "#000000"),
-    ]
+    return list(_small_values)
 
 
 def small_integers():
@@ -157,27 +181,26 @@ def small_integers():
 
 
 def small_ansi_to_html(i):
-    for ansi, html in small_values():
-        if i == ansi:
-            return html
-    return None
+    return colour_tables.small_htmls.get(i)
 
 
 def html_to_small_ansi(string):
-    hashed = hashed_html(string)
-    for ansi, html in small_values():
-        if html == hashed:
-            return ansi
-    return None
+    return colour_tables.html_smalls.get(hashed_html(string))
 
 
-def ansi_to_html(ansi):
+def _ansi_to_html(ansi):
     if ansi < 16:
         return small_ansi_to_html(ansi)
-    i = ansi_to_int(ansi)
+    i = _ansi_to_int(ansi)
     return integer_to_html(i)
 
 
+def ansi_to_html(ansi):
+    if 0 <= ansi < 256:
+        return colour_tables.ansi_htmls[ansi]
+    return _ansi_to_html(ansi)
+
+
 def name_to_id(name):
     """Get a number for that colour name
 
@@ -188,8 +211,7 @@ def name_to_id(name):
     if not name:
         return None
     lower = name.lower()
-    cga_names = {s: i for i, s in enumerate(colour_names.cga())}
-    return cga_names.get(lower) or html_to_small_ansi(lower)
+    return colour_tables.name_ids.get(lower) or html_to_small_ansi(lower)
 
 
 def id_to_name(i):
@@ -198,7 +220,6 @@ def id_to_name(i):
     >>> assert id_to_name(1) == 'red'
     """
     assert i >= 0
-    cgas = colour_names.cga()
-    if i < len(cgas):
-        return cgas[i].lower()
+    if i < 256:
+        return colour_tables.id_names[i]
     return ansi_to_html(i)
@@ -0,0 +1,41 @@
+"""Tables of colours, by ANSI number, html string and name
+
+The tables are built once, when first used
+    so that converting a known colour is one lookup, not a calculation
+
+Values are as calculated by colour_numbers, e.g.
+    >>> assert ansi_htmls[196] == '#FF0000' and ansi_rgbs[196] == (255, 0, 0)
+"""
+
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from pysyte.colours import colour_names
+from pysyte.colours import colour_numbers
+
+MAX_HTMLS = 4096  # html strings to remember converting to ANSI
+
+RGB = Tuple[int, int, int]
+
+small_htmls: Dict[int, str] = dict(colour_numbers._small_values)
+
+html_smalls: Dict[str, int] = {}
+for ansi, html in colour_numbers._small_values:
+    html_smalls.setdefault(html, ansi)
+
+name_ids: Dict[str, int] = {name: i for i, name in enumerate(colour_names.cga())}
+
+ansi_ints: List[int] = [colour_numbers._ansi_to_int(i) for i in range(256)]
+
+ansi_htmls: List[str] = [colour_numbers._ansi_to_html(i) for i in range(256)]
+
+ansi_rgbs: List[RGB] = [
+    ((i >> 16) & 0xFF, (i >> 8) & 0xFF, i & 0xFF) for i in ansi_ints
+]
+
+id_names: List[str] = [_.lower() for _ in colour_names.cga()] + ansi_htmls[16:]
+
+html_ansis: Dict[str, int] = {}  # filled as html strings are converted
+
+del ansi, html
@@ -0,0 +1,262 @@
+"""Find the nearest colour in a palette to any RGB
+
+Palettes are the xterm 256 colours (as a terminal actually shows them)
+    or the X11 colour names (from rgb.txt)
+    or any mapping of keys to RGB values
+
+Distance can be straight-line in RGB, or "redmean"
+    which weighs differences more as eyes see them
+    See https://en.wikipedia.org/wiki/Color_difference#sRGB
+
+Lookups are exact, but only compare colours which could be nearest
+    RGB space is divided into a grid, each cell of which lists its candidates
+Many colours can be converted at once, using NumPy if it is available
+"""
+
+from typing import Callable
+from typing import Dict
+from typing import Generic
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from pysyte.colours import colour_numbers
+
+RGB = Tuple[int, int, int]
+Colour = Union[RGB, int, str]  # (R, G, B), 0xRRGGBB, or "#RRGGBB"
+Distance = Callable[[tuple, tuple], float]
+Key = TypeVar("Key", bound=Hashable)
+
+CELL_BITS = 5  # cells are 32 values wide in each of R, G and B
+MAX_REMEMBERED = 1 << 16  # colours to remember the nearest of
+CHUNK = 1024  # colours to compare at once with NumPy
+
+cube_levels = (0, 95, 135, 175, 215, 255)
+grey_levels = tuple(8 + 10 * i for i in range(24))
+
+
+def euclidean(a: tuple, b: tuple) -> float:
+    """Square of the straight-line distance between two RGB colours
+
+    Works on numbers, or on NumPy arrays of them
+    """
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def redmean(a: tuple, b: tuple) -> float:
+    """Square of a distance between two RGB colours, as eyes see them
+
+    Works on numbers, or on NumPy arrays of them
+    """
+    mean_red = (a[0] + b[0]) / 2
+    return (
+        (2 + mean_red / 256) * (a[0] - b[0]) ** 2
+        + 4 * (a[1] - b[1]) ** 2
+        + (2 + (255 - mean_red) / 256) * (a[2] - b[2]) ** 2
+    )
+
+
+# Least and greatest weights each distance gives to R, G and B
+weights: Dict[Distance, Tuple[RGB, RGB]] = {
+    euclidean: ((1, 1, 1), (1, 1, 1)),
+    redmean: ((2, 4, 2), (3, 4, 3)),
+}
+
+
+def to_rgb(colour: Colour) -> RGB:
+    """That colour as a tuple of (R, G, B)
+
+    >>> assert to_rgb(0xFF8000) == to_rgb('#FF8000') == (255, 128, 0)
+    """
+    if isinstance(colour, int):
+        return (colour >> 16) & 0xFF, (colour >> 8) & 0xFF, colour & 0xFF
+    if isinstance(colour, str):
+        red, green, blue = colour_numbers.html_to_red_green_blue(colour)
+        if red is None:
+            raise ValueError(f"Not a colour: {colour!r}")
+        return red, green, blue
+    red, green, blue = colour
+    return red, green, blue
+
+
+def _gaps(value: int, low: int, high: int) -> Tuple[int, int]:
+    """Least and greatest gaps from value to anything in low..high"""
+    if value < low:
+        return low - value, high - value
+    if value > high:
+        return value - high, value - low
+    return 0, max(value - low, high - value)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class Palette(Generic[Key]):
+    """Some colours, each with a key, which can be searched by distance
+
+    Where colours are repeated, the first key is used
+    """
+
+    def __init__(self, colours: Mapping[Key, Colour], distance=euclidean):
+        self.distance = distance
+        self.keys: List[Key] = []
+        self.rgbs: List[RGB] = []
+        seen = set()
+        for key, colour in colours.items():
+            rgb = to_rgb(colour)
+            if rgb in seen:
+                continue
+            seen.add(rgb)
+            self.keys.append(key)
+            self.rgbs.append(rgb)
+        self.axes: Dict[Tuple[int, int], Tuple[list, list]] = {}
+        self.cells: Dict[RGB, List[int]] = {}
+        self.remembered: Dict[RGB, Key] = {}
+
+    def __repr__(self):
+        name = getattr(self.distance, "__name__", "distance")
+        return f"<{self.__class__.__name__} {len(self.keys)} colours by {name}>"
+
+    def __len__(self):
+        return len(self.keys)
+
+    def _axis_distances(self, axis: int, cell: int) -> Tuple[list, list]:
+        """Least and greatest distances of each colour from a slice of one axis"""
+        try:
+            return self.axes[axis, cell]
+        except KeyError:
+            pass
+        least_weights, greatest_weights = weights[self.distance]
+        least_weight, greatest_weight = least_weights[axis], greatest_weights[axis]
+        size = 1 << CELL_BITS
+        low, high = cell * size, cell * size + size - 1
+        gaps = [_gaps(rgb[axis], low, high) for rgb in self.rgbs]
+        distances = (
+            [least_weight * least**2 for least, _ in gaps],
+            [greatest_weight * most**2 for _, most in gaps],
+        )
+        self.axes[axis, cell] = distances
+        return distances
+
+    def _candidates(self, cell: RGB) -> List[int]:
+        """Indexes of the colours which could be nearest to any RGB in that cell
+
+        Any colour can be no nearer than its least distance to the cell
+            and the nearest colour is no further than any colour's greatest
+        """
+        try:
+            return self.cells[cell]
+        except KeyError:
+            pass
+        if self.distance in weights:
+            red, green, blue = [self._axis_distances(a, c) for a, c in enumerate(cell)]
+            furthest = min(map(sum, zip(red[1], green[1], blue[1])))
+            leasts = map(sum, zip(red[0], green[0], blue[0]))
+            candidates = [i for i, least in enumerate(leasts) if least <= furthest]
+        else:
+            candidates = list(range(len(self.rgbs)))
+        self.cells[cell] = candidates
+        return candidates
+
+    def nearest(self, colour: Colour) -> Key:
+        """The key of the colour nearest to that one"""
+        rgb = to_rgb(colour)
+        try:
+            return self.remembered[rgb]
+        except KeyError:
+            pass
+        red, green, blue = rgb
+        cell = red >> CELL_BITS, green >> CELL_BITS, blue >> CELL_BITS
+        candidates = self._candidates(cell)
+        distance, rgbs = self.distance, self.rgbs
+        best = min(candidates, key=lambda i: distance(rgb, rgbs[i]))
+        key = self.keys[best]
+        if len(self.remembered) < MAX_REMEMBERED:
+            self.remembered[rgb] = key
+        return key
+
+    def nearest_many(self, colours: Iterable[Colour]) -> List[Key]:
+        """The keys of the colours nearest to each of those"""
+        rgbs = [to_rgb(_) for _ in colours]
+        numpy = _numpy()
+        if numpy is None or len(rgbs) < CHUNK:
+            return [self.nearest(_) for _ in rgbs]
+        palette = numpy.array(self.rgbs, dtype=float).T
+        keys: List[Key] = []
+        for start in range(0, len(rgbs), CHUNK):
+            chunk = numpy.array(rgbs[start : start + CHUNK], dtype=float)
+            columns = tuple(chunk[:, [_]] for _ in range(3))
+            distances = self.distance(columns, palette)
+            keys.extend(self.keys[_] for _ in distances.argmin(axis=1))
+        return keys
+
+
+def xterm_rgbs() -> Dict[int, RGB]:
+    """RGB values for the xterm colours 16 to 255
+
+    The 16 colours below those are left out, as terminals' themes change them
+    """
+    cube = {
+        16 + 36 * r + 6 * g + b: (cube_levels[r], cube_levels[g], cube_levels[b])
+        for r in range(6)
+        for g in range(6)
+        for b in range(6)
+    }
+    greys = {232 + i: (level, level, level) for i, level in enumerate(grey_levels)}
+    return {**cube, **greys}
+
+
+_xterm_palettes: Dict[Distance, Palette[int]] = {}
+_x11_palettes: Dict[Distance, Palette[str]] = {}
+
+
+def xterm_palette(distance: Distance = euclidean) -> Palette[int]:
+    try:
+        return _xterm_palettes[distance]
+    except KeyError:
+        palette = _xterm_palettes[distance] = Palette(xterm_rgbs(), distance)
+        return palette
+
+
+def x11_palette(distance: Distance = euclidean) -> Palette[str]:
+    try:
+        return _x11_palettes[distance]
+    except KeyError:
+        from pysyte.colours import x11_colour_names
+
+        palette = _x11_palettes[distance] = Palette(x11_colour_names.names(), distance)
+        return palette
+
+
+def rgb_to_ansi(colour: Colour, distance: Distance = euclidean) -> int:
+    """The xterm colour nearest to that one
+
+    >>> assert rgb_to_ansi((0, 0, 0x5F)) == 17
+    >>> assert rgb_to_ansi('#808080') == 244
+    """
+    return xterm_palette(distance).nearest(colour)
+
+
+def rgbs_to_ansis(colours: Iterable[Colour], distance=euclidean) -> List[int]:
+    return xterm_palette(distance).nearest_many(colours)
+
+
+def rgb_to_name(colour: Colour, distance: Distance = euclidean) -> str:
+    """The X11 colour name nearest to that colour
+
+    >>> assert rgb_to_name((250, 5, 5)) == 'red'
+    """
+    return x11_palette(distance).nearest(colour)
+
+
+def rgbs_to_names(colours: Iterable[Colour], distance=euclidean) -> List[str]:
+    return x11_palette(distance).nearest_many(colours)
@@ -1,3 +1,4 @@
+import io
 import unittest
 
 from pysyte.colours import ansi_escapes
@@ -51,3 +52,17 @@ class TestEscapes(unittest.TestCase):
     def test_no_background(self):
         "Nothing in, nothing out" ""
         self.assertFalse(ansi_escapes.background(0))
+
+    def test_render(self):
+        """Colours are only set and reset where they change"""
+        spans = [("a", 3, None), ("b", 3, 0), ("c", 3, 5), ("d", None, None)]
+        reset = ansi_escapes.no_colour()
+        expected = f"\x1b[33mab{reset}\x1b[45m\x1b[33mc{reset}d"
+        self.assertEqual(ansi_escapes.render(spans), expected)
+
+    def test_write(self):
+        """Spans can be written to a stream"""
+        spans = [("a", 1, 2), ("b", None, None)]
+        stream = io.StringIO()
+        ansi_escapes.write(spans, stream)
+        self.assertEqual(stream.getvalue(), ansi_escapes.render(spans))
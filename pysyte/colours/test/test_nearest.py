@@ -0,0 +1,26 @@
+"""Test the nearest module"""
+
+import random
+import unittest
+
+from pysyte.colours import nearest
+
+
+@unittest.skipUnless(nearest._numpy(), "NumPy is not installed")
+class TestNearestMany(unittest.TestCase):
+    """Many colours at once are compared with NumPy, as each would be alone"""
+
+    def setUp(self):
+        randoms = random.Random(0)
+        count = nearest.CHUNK * 2 + 10
+        self.colours = [randoms.randrange(0x1000000) for _ in range(count)]
+
+    def assert_nearest(self, palette):
+        expected = [palette.nearest(_) for _ in self.colours]
+        self.assertEqual(palette.nearest_many(self.colours), expected)
+
+    def test_euclidean(self):
+        self.assert_nearest(nearest.Palette(nearest.xterm_rgbs()))
+
+    def test_redmean(self):
+        self.assert_nearest(nearest.Palette(nearest.xterm_rgbs(), nearest.redmean))
@@ -16,6 +16,14 @@ from pysyte.colours import colour_names
 from pysyte.colours import colour_numbers
 
 
+def _colour_method(colour_name):
+    def colour_method(self, text):
+        return self.colour_text(colour_name, text)
+
+    colour_method.__name__ = (colour_name or "none").replace(" ", "_")
+    return colour_method
+
+
 class ColouredTail(object):
     """The tail of a string that is being coloured
 
@@ -23,25 +31,46 @@ class ColouredTail(object):
         which is all of the string before the tail
 
     When treated as a string, gives head + tail
+
+    Colouring more text gives a new tail, which holds this one as its head
+        so nothing is joined into a string until str() is needed
     """
 
-    def __init__(self, head, tail):
-        self.head = str(head) if head else ""
-        self.tail = str(tail) if tail else ""
-        self.add_colour_names()
+    __slots__ = ("_head", "_text", "number", "_string")
+
+    def __init__(self, head, tail, number=None):
+        self._head = head if isinstance(head, ColouredTail) else str(head or "")
+        self._text = str(tail) if tail else ""
+        self.number = number
+        self._string = None
 
-    def add_colour_names(self):
-        for colour_name in colour_names.cga():
-            attr_name = colour_name.replace(" ", "_")
-            setattr(self, attr_name, partial(self.colour_text, colour_name))
-        setattr(self, "reddy", partial(self.colour_text, "light red"))
-        setattr(self, "none", partial(self.colour_text, None))
+    @property
+    def head(self):
+        return str(self._head)
+
+    @property
+    def tail(self):
+        if self.number is None:
+            return self._text
+        return ansi_escapes.foreground_string(self._text, self.number)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.head!r}{self.tail!r}>"
 
     def __str__(self):
-        return f"{self.head}{self.tail}"
+        if self._string is None:
+            tails = []
+            coloured = self
+            while isinstance(coloured, ColouredTail):
+                if coloured._string is not None:
+                    tails.append(coloured._string)
+                    break
+                tails.append(coloured.tail)
+                coloured = coloured._head
+            else:
+                tails.append(coloured)
+            self._string = "".join(reversed(tails))
+        return self._string
 
     def __eq__(self, other):
         return str(self) == str(other)
@@ -52,20 +81,20 @@ class ColouredTail(object):
         except ValueError:
             colour_name = None
             text = args[0]
-        new = colour_text(colour_name, text, head="")
-        return ColouredTail(str(self), new)
+        return ColouredTail(self, str(text), colour_numbers.name_to_id(colour_name))
 
     colour = text = colour_text
 
+    reddy = _colour_method("light red")
+    none = _colour_method(None)
+
+
+for name in colour_names.cga():
+    setattr(ColouredTail, name.replace(" ", "_"), _colour_method(name))
+
 
 def colour_text(colour_name, text, head=None):
-    return ColouredTail(
-        head or "",
-        ansi_escapes.foreground_string(
-            str(text),
-            colour_numbers.name_to_id(colour_name),
-        ),
-    )
+    return ColouredTail(head, str(text), colour_numbers.name_to_id(colour_name))
 
 
 colour = text = colour_text
@@ -7,11 +7,33 @@ The rgb.txt file is expected to contain X11 colour names
     so the "known directory" is <X11root>/lib/X11/
         Some variations on that official path are also tried
     See http://en.wikipedia.org/wiki/X11_color_names
+
+The file is parsed once, into a compact store of names and packed RGB values
+    which is also kept on disk, until the rgb.txt file changes
 """
 
 
+import bisect
+import difflib
 import os
+import pickle
 import re
+from array import array
+from types import MappingProxyType
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Tuple
+
+from pysyte.oss import linux
+
+RGB = Tuple[int, int, int]
+
+_rgb_line = re.compile(
+    r"([ 0-9][ 0-9][ 0-9])\s+([ 0-9][ 0-9][ 0-9])\s+([ 0-9][ 0-9][ 0-9])"
+    r"\s+([a-zA-Z0-9 ]+)\s*"
+)
 
 
 def _rgb_txt_directories():
@@ -45,44 +67,195 @@ def _rgb_txt_line(string):
 
     Gives a name and 3 integers (RGB values)
     """
-    regexp = re.compile(
-        r"([ 0-9][ 0-9][ 0-9])\s+([ 0-9][ 0-9][ 0-9])\s+([ 0-9][ 0-9][ 0-9])"
-        r"\s+([a-zA-Z0-9 ]+)\s*"
-    )
-    match = regexp.match(string)
+    match = _rgb_line.match(string)
     if not match:
         return "", (-1, -1, -1)
     red, green, blue, name = match.groups()
     return name.strip(), (int(red), int(green), int(blue))
 
 
+def _key(name: str) -> str:
+    """Names are matched without case or spaces, e.g. "ghost white" or GhostWhite"""
+    return name.replace(" ", "").lower()
+
+
+class ColourNames:
+    """Names of colours, with their RGB values packed in an array
+
+    >>> colours = ColourNames(['red', 'dark red'], array('B', [255, 0, 0, 139, 0, 0]))
+    >>> assert colours['DarkRed'] == (139, 0, 0)
+    """
+
+    def __init__(self, names: List[str], values: array):
+        self.names = names
+        self.values = values
+        self.index: Dict[str, int] = {}
+        for i, name in enumerate(names):
+            self.index.setdefault(_key(name), i)
+        self.keys = sorted(self.index)
+        self._mapping: Optional[Mapping[str, RGB]] = None
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.names)} names>"
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return _key(name) in self.index
+
+    def __getitem__(self, name: str) -> RGB:
+        return self.rgb(self.index[_key(name)])
+
+    def get(self, name: str, default=None) -> Optional[RGB]:
+        try:
+            return self[name]
+        except KeyError:
+            return default
+
+    def rgb(self, i: int) -> RGB:
+        red, green, blue = self.values[i * 3 : i * 3 + 3]
+        return red, green, blue
+
+    def items(self):
+        return ((name, self.rgb(i)) for i, name in enumerate(self.names))
+
+    def mapping(self) -> Mapping[str, RGB]:
+        """A read-only {name: (R, G, B)}, made once"""
+        if self._mapping is None:
+            self._mapping = MappingProxyType(dict(self.items()))
+        return self._mapping
+
+    def _name(self, key: str) -> str:
+        return self.names[self.index[key]]
+
+    def prefixed(self, prefix: str) -> List[str]:
+        """Names which start with that prefix
+
+        >>> colours = ColourNames(['red', 'dark red', 'DarkRed'], array('B', [0] * 9))
+        >>> colours.prefixed('Dark')
+        ['dark red']
+        """
+        key = _key(prefix)
+        start = bisect.bisect_left(self.keys, key)
+        end = bisect.bisect_left(self.keys, key + "\uffff", start)
+        return [self._name(_) for _ in self.keys[start:end]]
+
+    def like(self, name: str, count: int = 5, cutoff: float = 0.6) -> List[str]:
+        """Names which are most like that name, e.g. when misspelt"""
+        keys = difflib.get_close_matches(_key(name), self.keys, count, cutoff)
+        return [self._name(_) for _ in keys]
+
+    @classmethod
+    def parse(cls, path_to_file: str) -> "ColourNames":
+        names: List[str] = []
+        values = array("B")
+        with open(path_to_file) as stream:
+            for line in stream:
+                name, rgb = _rgb_txt_line(line)
+                if name:
+                    names.append(name)
+                    values.extend(rgb)
+        return cls(names, values)
+
+
+def default_path_to_cache() -> str:
+    """Where parsed rgb.txt files are kept, unless told otherwise"""
+    return os.path.join(linux.xdg_cache_dir(), "pysyte", "x11_colour_names.pickle")
+
+
+def _source_key(path_to_file: str) -> Tuple[str, int, int]:
+    stat = os.stat(path_to_file)
+    return os.path.abspath(path_to_file), stat.st_mtime_ns, stat.st_size
+
+
+def _read_cache(path_to_cache: str, key: tuple) -> Optional[ColourNames]:
+    try:
+        with open(path_to_cache, "rb") as stream:
+            cached_key, names, values = pickle.load(stream)
+    except (OSError, pickle.PickleError, EOFError, ValueError, TypeError):
+        return None
+    if cached_key != key:
+        return None
+    return ColourNames(names, array("B", values))
+
+
+def _write_cache(path_to_cache: str, key: tuple, colours: ColourNames) -> None:
+    temporary = f"{path_to_cache}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(path_to_cache), exist_ok=True)
+        with open(temporary, "wb") as stream:
+            data = key, colours.names, colours.values.tobytes()
+            pickle.dump(data, stream, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path_to_cache)
+    except (OSError, pickle.PickleError):
+        pass
+
+
+def load(path_to_file: str, path_to_cache=None) -> ColourNames:
+    """Colour names from that file, from the cache on disk if it is unchanged
+
+    Use a path_to_cache of False to not keep a cache on disk
+    """
+    key = _source_key(path_to_file)
+    if path_to_cache is False:
+        return ColourNames.parse(path_to_file)
+    path_to_cache = path_to_cache or default_path_to_cache()
+    colours = _read_cache(path_to_cache, key)
+    if colours is None:
+        colours = ColourNames.parse(path_to_file)
+        _write_cache(path_to_cache, key, colours)
+    return colours
+
+
+_stores: Dict[str, ColourNames] = {}
+
+
 def _rgb_txt_names_and_numbers(path_to_file):
     """Parse all lines from that file
 
     Expects that each line has a name and RGB values
     """
+    colours = _store(path_to_file)
+    return list(colours.items()) if colours else []
+
+
+def _store(path_to_file) -> Optional[ColourNames]:
+    """Colour names from that file, loaded once"""
     if not path_to_file or not os.path.isfile(path_to_file):
-        return []
-    if not hasattr(_rgb_txt_names_and_numbers, "result"):
-        rgb_lines = [_rgb_txt_line(_) for _ in open(path_to_file)]
-        _rgb_txt_names_and_numbers.result = [
-            (name, values) for name, values in rgb_lines if name
-        ]
-    return _rgb_txt_names_and_numbers.result
+        return None
+    try:
+        return _stores[path_to_file]
+    except KeyError:
+        colours = _stores[path_to_file] = load(path_to_file)
+        return colours
+
+
+_local_files: List[Optional[str]] = []
+
+
+def _local_rgb_file() -> Optional[str]:
+    if not _local_files:
+        path_to_file = first_rgb_file(_rgb_txt_directories)
+        _local_files.append(path_to_file and os.path.abspath(path_to_file))
+    return _local_files[0]
+
+
+def local_names() -> ColourNames:
+    """The store of colour names from local machine"""
+    return _store(_local_rgb_file()) or ColourNames([], array("B"))
 
 
 def _local_rgb_txt_names_and_numbers():
     """Names and RGB values from local machine"""
-    path_to_rgb_txt = first_rgb_file(_rgb_txt_directories)
-    return _rgb_txt_names_and_numbers(path_to_rgb_txt)
+    return list(local_names().items())
 
 
 def names():
-    """Dictionary of available colours as {name: (R, G, B)}
+    """Read-only dictionary of available colours as {name: (R, G, B)}
 
     Look for colours in an X11 rgb.txt
 
     >>> assert names()['green'] == (0, 255, 0)
     """
-    names_and_numbers = _local_rgb_txt_names_and_numbers()
-    return dict(names_and_numbers)
+    return local_names().mapping()
@@ -0,0 +1,121 @@
+"""Keep parsed config files, so each is only parsed once
+
+Parsed data is kept for each path, with that file's mtime and size
+    and is parsed again if either has changed
+
+The cache can also be kept on disk, as a pickled snapshot
+    so that later processes need not parse unchanged files at all
+"""
+
+import copy
+import os
+import pickle
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from pysyte.oss import linux
+
+Key = Tuple[int, int]  # mtime_ns, size
+
+
+def default_path_to_snapshot() -> str:
+    """Where snapshots are kept, unless told otherwise"""
+    return os.path.join(linux.xdg_cache_dir(), "pysyte", "configs.pickle")
+
+
+def _key(path_: str) -> Optional[Key]:
+    try:
+        stat = os.stat(path_)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class ParsedConfigs:
+    """Parsed data for config files, while those files are unchanged
+
+    Data is copied out, so callers cannot change what is kept
+    """
+
+    def __init__(self, path_to_snapshot: Optional[str] = None):
+        self.path_to_snapshot = path_to_snapshot or ""
+        self.parsed: Dict[str, Tuple[Key, Any]] = {}
+        if path_to_snapshot:
+            self._read_snapshot()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self.parsed)} files>"
+
+    def __len__(self) -> int:
+        return len(self.parsed)
+
+    def _read_snapshot(self) -> None:
+        """Keep what is in the snapshot, unless it is corrupt or out of date
+
+        A snapshot which cannot be read is thrown away, so files are parsed again
+        """
+        try:
+            with open(self.path_to_snapshot, "rb") as stream:
+                snapshot = pickle.load(stream)
+            parsed = {str(k): (key, data) for k, (key, data) in snapshot.items()}
+        except FileNotFoundError:
+            return
+        except Exception:  # e.g. pickled by another version, of other classes
+            try:
+                os.remove(self.path_to_snapshot)
+            except OSError:
+                pass
+            return
+        self.parsed.update(parsed)
+
+    def _write_snapshot(self) -> None:
+        """Keep the cache on disk, if it can be written"""
+        temporary = f"{self.path_to_snapshot}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(self.path_to_snapshot), exist_ok=True)
+            with open(temporary, "wb") as stream:
+                pickle.dump(self.parsed, stream, pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path_to_snapshot)
+        except (OSError, pickle.PickleError):
+            pass
+
+    def load(self, path_, parse: Callable[[str], Any]) -> Any:
+        """Data for that path, from parse(path) if not already kept"""
+        path_ = str(path_)
+        key = _key(path_)
+        try:
+            kept_key, data = self.parsed[path_]
+            if key is not None and kept_key == key:
+                return copy.deepcopy(data)
+        except KeyError:
+            pass
+        data = parse(path_)
+        if key is not None:
+            self.parsed[path_] = key, copy.deepcopy(data)
+            if self.path_to_snapshot:
+                self._write_snapshot()
+        return data
+
+    def clear(self) -> None:
+        self.parsed.clear()
+
+
+parsed_configs = ParsedConfigs()
+
+
+def use_snapshot(path_to_snapshot: Optional[str] = None) -> ParsedConfigs:
+    """Keep parsed configs on disk, as well as in this process"""
+    global parsed_configs
+    path_ = path_to_snapshot or default_path_to_snapshot()
+    snapshot = ParsedConfigs(path_)
+    snapshot.parsed.update(parsed_configs.parsed)
+    parsed_configs = snapshot
+    return parsed_configs
+
+
+def load(path_, parse: Callable[[str], Any]) -> Any:
+    """Data for that path, from the cache in use"""
+    return parsed_configs.load(path_, parse)
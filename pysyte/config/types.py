@@ -2,11 +2,19 @@
 
 from dataclasses import dataclass
 
+from pysyte.config import cache
 from pysyte.types import paths
 from pysyte.types.dictionaries import NameSpaces
 from pysyte.types.paths import FileTypes
 
 
+def yaml_load(path_):
+    """Data from that yaml file"""
+    from yamlreader import yaml_load as yamlreader_load
+
+    return yamlreader_load(str(path_))
+
+
 class Configuration(NameSpaces):
     """We'll use a new name now"""
 
@@ -37,7 +45,7 @@ class YamlConfiguration(PysyteConfiguration):
         super().__init__(paths.path(module))
 
     def load(self, path):
-        return yaml_load(path)
+        return cache.load(path, yaml_load)
 
     def extensions(self):
         return ("yml", "yaml")
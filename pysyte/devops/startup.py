@@ -0,0 +1,246 @@
+"""Measure how quickly pysyte's scripts start
+
+For each entry point, measure
+    cold: seconds for a run with no bytecode cached
+    warm: median seconds over some runs, with bytecode cached
+    rss: peak resident memory (KiB) of a warm run
+    imports: how many modules are imported
+
+Results can be saved as a baseline (in json)
+    and later results checked against a budget over that baseline
+
+Usage: python -m pysyte.devops.startup [--save] [--baseline path]
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from dataclasses import dataclass
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@dataclass
+class EntryPoint:
+    """A way to start pysyte, as arguments to python"""
+
+    name: str
+    args: List[str]
+
+    def command(self, *options: str) -> List[str]:
+        return [sys.executable, *options, *self.args]
+
+    def exists(self) -> bool:
+        """Scripts are only in a checkout, modules are always there"""
+        script = self.args[0]
+        return script.startswith("-") or os.path.isfile(script)
+
+
+def _script(name: str) -> EntryPoint:
+    return EntryPoint(name, [os.path.join(root, "bin", name), "--help"])
+
+
+def _module(name: str) -> EntryPoint:
+    return EntryPoint(name, ["-m", name, "--help"])
+
+
+entry_points = [
+    _script("kat"),
+    _script("short_dir"),
+    _script("rePATH"),
+    _script("oui"),
+    _module("pysyte.kat"),
+    _module("pysyte.imports"),
+    _module("pysyte.keys"),
+]
+
+
+@dataclass
+class Startup:
+    """How an entry point started"""
+
+    name: str
+    cold: float
+    warm: float
+    rss: int
+    imports: int
+    exit_code: int
+
+
+@dataclass
+class Budget:
+    """How far over a baseline results can go
+
+    Times and memory can grow by ratio, times also by slack seconds
+        to allow for noise in very quick starts
+    Imports can grow by that many modules
+    """
+
+    ratio: float = 1.25
+    slack: float = 0.01
+    imports: int = 0
+
+
+def _environment(**values: str) -> Dict[str, str]:
+    environment = dict(os.environ)
+    environment.update(values)
+    return environment
+
+
+def run_once(command: List[str], environment=None) -> Tuple[float, int, int]:
+    """Seconds taken, peak RSS in KiB, and exit code for that command"""
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=environment,
+    )
+    _, status, usage = os.wait4(process.pid, 0)
+    seconds = time.perf_counter() - start
+    process.returncode = os.waitstatus_to_exitcode(status)
+    rss = usage.ru_maxrss // 1024 if sys.platform == "darwin" else usage.ru_maxrss
+    return seconds, rss, process.returncode
+
+
+def count_imports(entry_point: EntryPoint) -> int:
+    """How many modules that entry point imports, per python -X importtime"""
+    command = entry_point.command("-X", "importtime")
+    process = subprocess.run(
+        command, stdin=subprocess.DEVNULL, capture_output=True, text=True
+    )
+    lines = process.stderr.splitlines()
+    imports = [_ for _ in lines if _.startswith("import time:")]
+    return max(len(imports) - 1, 0)  # less the header
+
+
+def measure(entry_point: EntryPoint, runs: int = 5) -> Startup:
+    """Time cold and warm starts of that entry point"""
+    with tempfile.TemporaryDirectory() as no_bytecode:
+        cold_environment = _environment(PYTHONPYCACHEPREFIX=no_bytecode)
+        cold, _, _ = run_once(entry_point.command(), cold_environment)
+    command = entry_point.command()
+    run_once(command)
+    warm_runs = [run_once(command) for _ in range(max(runs, 1))]
+    warm = statistics.median(_[0] for _ in warm_runs)
+    rss = max(_[1] for _ in warm_runs)
+    exit_code = warm_runs[-1][2]
+    imports = count_imports(entry_point)
+    return Startup(entry_point.name, cold, warm, rss, imports, exit_code)
+
+
+def measure_all(
+    entry_points_: Optional[List[EntryPoint]] = None, runs: int = 5
+) -> List[Startup]:
+    """Measure all those entry points (default all of pysyte's) that exist"""
+    wanted = entry_points if entry_points_ is None else entry_points_
+    return [measure(_, runs) for _ in wanted if _.exists()]
+
+
+def save(results: List[Startup], path_: str) -> None:
+    """Save those results as a baseline"""
+    baseline = {
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "results": {_.name: asdict(_) for _ in results},
+    }
+    with open(path_, "w") as stream:
+        json.dump(baseline, stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+
+def load(path_: str) -> Dict[str, Startup]:
+    """Results from a saved baseline"""
+    with open(path_) as stream:
+        baseline = json.load(stream)
+    return {k: Startup(**v) for k, v in baseline["results"].items()}
+
+
+def over_budget(
+    results: List[Startup], baseline: Dict[str, Startup], budget: Budget
+) -> List[str]:
+    """Descriptions of any results which are over budget, against that baseline
+
+    A result which failed to start is over any budget, however quick it was
+
+    >>> old = Startup('kat', 0.1, 0.04, 10000, 100, 0)
+    >>> new = Startup('kat', 0.1, 0.08, 10000, 101, 0)
+    >>> over_budget([new], {'kat': old}, Budget())
+    ['kat: warm 0.080s > 0.060s', 'kat: imports 101 > 100']
+    >>> assert not over_budget([new], {'kat': old}, Budget(ratio=2, imports=1))
+    >>> failed = Startup('kat', 0.05, 0.02, 5000, 50, 1)
+    >>> over_budget([failed], {'kat': failed}, Budget())
+    ['kat: exit code 1 (baseline 1)']
+    """
+    over = []
+    for result in results:
+        try:
+            expected = baseline[result.name]
+        except KeyError:
+            continue
+        if result.exit_code or result.exit_code != expected.exit_code:
+            over.append(
+                f"{result.name}: exit code {result.exit_code}"
+                f" (baseline {expected.exit_code})"
+            )
+        for name in ("cold", "warm"):
+            actual, allowed = getattr(result, name), getattr(expected, name)
+            allowed = allowed * budget.ratio + budget.slack
+            if actual > allowed:
+                over.append(f"{result.name}: {name} {actual:.3f}s > {allowed:.3f}s")
+        allowed_rss = int(expected.rss * budget.ratio)
+        if result.rss > allowed_rss:
+            over.append(f"{result.name}: rss {result.rss}KiB > {allowed_rss}KiB")
+        allowed_imports = expected.imports + budget.imports
+        if result.imports > allowed_imports:
+            over.append(f"{result.name}: imports {result.imports} > {allowed_imports}")
+    return over
+
+
+def report(results: List[Startup]) -> str:
+    lines = [f"{'':20} {'cold':>8} {'warm':>8} {'rss KiB':>9} {'imports':>8}"]
+    for result in results:
+        lines.append(
+            f"{result.name:20} {result.cold:8.3f} {result.warm:8.3f}"
+            f" {result.rss:9d} {result.imports:8d}"
+        )
+    return "\n".join(lines)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-b", "--baseline", default="startup.json")
+    parser.add_argument("-s", "--save", action="store_true", help="save baseline")
+    parser.add_argument("-r", "--runs", type=int, default=5, help="warm runs")
+    parser.add_argument("--ratio", type=float, default=Budget.ratio)
+    parser.add_argument("--slack", type=float, default=Budget.slack)
+    parser.add_argument("--imports", type=int, default=Budget.imports)
+    args = parser.parse_args(arguments)
+    results = measure_all(runs=args.runs)
+    print(report(results))
+    if args.save:
+        save(results, args.baseline)
+        return 0
+    if not os.path.isfile(args.baseline):
+        return 0
+    budget = Budget(args.ratio, args.slack, args.imports)
+    over = over_budget(results, load(args.baseline), budget)
+    for line in over:
+        print(line, file=sys.stderr)
+    return 1 if over else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Import modules only when they are first used
+
+Scripts which start often (e.g. from a shell prompt) should not pay
+    for importing what they do not use on that run
+
+    >>> textwrap = lazy_import('textwrap')
+    >>> assert textwrap.dedent('  fred') == 'fred'
+"""
+
+import functools
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Callable
+from typing import List
+
+
+def lazy_import(name: str) -> ModuleType:
+    """A module which is only loaded when an attribute is first used
+
+    Any parent packages are imported now, as they are needed to find it
+    If the module is already loaded then that is used
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        pass
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def submodule(package: str, name: str) -> ModuleType:
+    """Import that module from that package, for a package's __getattr__()
+
+    Raises AttributeError if there is no such module
+    """
+    if name.startswith("_"):
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+    try:
+        return importlib.import_module(f"{package}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{package}.{name}":
+            raise
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+
+def lazy_decorator(module: str, name: str, *args, **kwargs) -> Callable:
+    """Decorate with module.name(*args, **kwargs), when first called
+
+    So the decorator's module is not imported just to define a method
+    """
+
+    def decorate(method: Callable) -> Callable:
+        decorated: List[Callable] = []
+
+        @functools.wraps(method)
+        def lazily_decorated(*args_, **kwargs_):
+            if not decorated:
+                decorator = getattr(importlib.import_module(module), name)
+                decorated.append(decorator(*args, **kwargs)(method))
+            return decorated[0](*args_, **kwargs_)
+
+        return lazily_decorated
+
+    return decorate
@@ -0,0 +1,152 @@
+"""Copy to, and paste from, the clipboard
+
+Each platform has some commands which can use its clipboard (e.g. xclip)
+    the first of which that can be used here is chosen once, and kept
+If none can be used (e.g. on a headless machine) a file is used instead
+    and that file can be chosen by $PYSYTE_CLIPBOARD (e.g. for tests)
+
+Pasted text is streamed from the command, so is not all held in memory
+"""
+
+import io
+import os
+import shlex
+import shutil
+import subprocess
+from typing import BinaryIO
+from typing import List
+from typing import Optional
+from typing import TextIO
+
+from pysyte.oss import linux
+from pysyte.oss import platforms
+
+
+class Clipboard:
+    """Somewhere to copy text to, and paste it from"""
+
+    name = "clipboard"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name}>"
+
+    def available(self) -> bool:
+        """Whether this clipboard can be used here"""
+        return True
+
+    def copy(self, data: str) -> None:
+        raise NotImplementedError
+
+    def stream(self, name: str = "") -> TextIO:
+        """A stream of text from the clipboard, which should be closed"""
+        raise NotImplementedError
+
+    def paste(self) -> str:
+        with self.stream() as stream:
+            return stream.read()
+
+
+class ClipboardStream(io.TextIOWrapper):
+    """Text from a clipboard, and any paste command is waited for when closed"""
+
+    def __init__(self, buffer, name: str, process=None):
+        super().__init__(buffer, encoding="utf-8")
+        self._name = name
+        self.process = process
+
+    @property
+    def name(self):
+        return self._name
+
+    def close(self):
+        if self.closed:
+            return
+        super().close()
+        if self.process:
+            self.process.wait()
+
+
+class CommandClipboard(Clipboard):
+    """A clipboard used through commands, e.g. pbcopy and pbpaste"""
+
+    def __init__(self, copy_command: str, paste_command: str, needs: str = ""):
+        self.copy_command = shlex.split(copy_command)
+        self.paste_command = shlex.split(paste_command)
+        self.needs = needs
+        self.name = self.copy_command[0]
+
+    def available(self) -> bool:
+        """Whether the commands are installed, and the display they need is set"""
+        if self.needs and not os.environ.get(self.needs):
+            return False
+        commands = {self.copy_command[0], self.paste_command[0]}
+        return all(shutil.which(_) for _ in commands)
+
+    def copy(self, data: str) -> None:
+        subprocess.run(self.copy_command, input=data, encoding="utf-8", check=True)
+
+    def stream(self, name: str = "") -> TextIO:
+        process = subprocess.Popen(
+            self.paste_command, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE
+        )
+        return ClipboardStream(process.stdout, name or f"<{self.name}>", process)
+
+
+class FileClipboard(Clipboard):
+    """A file which stands in for a clipboard"""
+
+    def __init__(self, path_: str):
+        self.path = os.path.expanduser(str(path_))
+        self.name = self.path
+
+    def copy(self, data: str) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}"
+        with open(temporary, "w", encoding="utf-8") as stream:
+            stream.write(data)
+        os.replace(temporary, self.path)
+
+    def stream(self, name: str = "") -> TextIO:
+        buffer: BinaryIO
+        try:
+            buffer = open(self.path, "rb")
+        except FileNotFoundError:
+            buffer = io.BytesIO()
+        return ClipboardStream(buffer, name or self.path)
+
+
+def default_path_to_file() -> str:
+    """Where the stand-in clipboard is kept, unless told otherwise"""
+    return os.path.join(linux.xdg_cache_dir(), "pysyte", "clipboard")
+
+
+def candidates() -> List[Clipboard]:
+    """Clipboards this platform might have, in order of preference"""
+    commands = getattr(platforms.platform, "clipboards", [])
+    return [CommandClipboard(*_) for _ in commands]
+
+
+def choose() -> Clipboard:
+    """The first clipboard which can be used here"""
+    path_ = os.environ.get("PYSYTE_CLIPBOARD")
+    if path_:
+        return FileClipboard(path_)
+    for candidate in candidates():
+        if candidate.available():
+            return candidate
+    return FileClipboard(default_path_to_file())
+
+
+_clipboards: List[Clipboard] = []
+
+
+def clipboard() -> Clipboard:
+    """The clipboard to use, chosen once"""
+    if not _clipboards:
+        _clipboards.append(choose())
+    return _clipboards[0]
+
+
+def use(clipboard_: Optional[Clipboard] = None) -> None:
+    """Use that clipboard from now on, or choose again if None"""
+    _clipboards[:] = [clipboard_] if clipboard_ else []
@@ -2,3 +2,5 @@
 
 bash_paste = "/usr/bin/pbpaste"
 bash_copy = "/usr/bin/pbcopy"
+
+clipboards = [(bash_copy, bash_paste, "")]  # copy, paste, and the display they need
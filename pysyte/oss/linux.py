@@ -1,7 +1,10 @@
 """Linux-specific code"""
 
+import os
 
-from pysyte.types import paths
+from pysyte.lazy import lazy_import
+
+paths = lazy_import("pysyte.types.paths")
 
 
 def xdg_home():
@@ -20,6 +23,19 @@ def xdg_home_config(filename):
     return xdg_home() / filename
 
 
+def xdg_cache_home():
+    """path to $XDG_CACHE_HOME"""
+    return paths.environ_path("XDG_CACHE_HOME", "~/.cache")
+
+
+def xdg_cache_dir() -> str:
+    """$XDG_CACHE_HOME, as a string, without importing paths
+
+    >>> assert xdg_cache_dir() == str(xdg_cache_home().expand())
+    """
+    return os.path.expanduser(os.environ.get("XDG_CACHE_HOME", "~/.cache"))
+
+
 def xdg_dirs():
     """paths in $XDG_CONFIG_DIRS"""
     return paths.environ_paths("XDG_CONFIG_DIRS")
@@ -29,5 +45,11 @@ def xdg_homes():
     return [xdg_home()]
 
 
-bash_paste = "xclip -selection clipboard"
-bash_copy = "xclip -selection clipboard -o"
+bash_paste = "xclip -selection clipboard -o"
+bash_copy = "xclip -selection clipboard"
+
+clipboards = [  # copy, paste, and the display they need
+    ("wl-copy", "wl-paste --no-newline", "WAYLAND_DISPLAY"),
+    (bash_copy, bash_paste, "DISPLAY"),
+    ("xsel --clipboard --input", "xsel --clipboard --output", "DISPLAY"),
+]
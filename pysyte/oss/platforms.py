@@ -1,16 +1,22 @@
 """Handle different OS platforms"""
 import platform as python_platform
 import importlib
-from subprocess import run
+
+from pysyte.lazy import lazy_import
 
 name = python_platform.system().lower()
 platform = importlib.import_module(f"pysyte.oss.{name}", "pysyte.oss")
+clipboards = lazy_import("pysyte.oss.clipboards")
 
 
 def put_clipboard_data(data):
-    run(platform.bash_copy, encoding="utf-8", input=data)
+    clipboards.clipboard().copy(data)
 
 
 def get_clipboard_data():
-    result = run(platform.bash_paste, capture_output=True, encoding="utf-8")
-    return result.stdout
+    return clipboards.clipboard().paste()
+
+
+def clipboard_stream(name=""):
+    """A stream of text from the clipboard, read as it is pasted"""
+    return clipboards.clipboard().stream(name)
@@ -1,28 +1,156 @@
-from subprocess import getstatusoutput
+"""Terminal sizes and capabilities, without running tput
+
+The size is asked of the terminal (as tput would) and kept
+    until the terminal says it has been resized (by SIGWINCH)
+Capabilities are looked up in terminfo once per $TERM, and kept
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Tuple
 
 
 class NoTerminalAvailable(NotImplementedError):
     pass
 
 
-def _tput(tput_command):
-    command = f"tput {tput_command}"
-    status, output = getstatusoutput(command)
-    if status:
-        if "No value for $TERM" in output:
-            raise NoTerminalAvailable(output)
-        raise NotImplementedError(output)
-    if not output:
-        return 0
+_sizes: List[os.terminal_size] = []
+_handlers: List[Callable] = []
+_capabilities: Dict[Tuple[str, str], bytes] = {}
+_setup_terms: List[str] = []
+
+
+def _resized(signum, frame, previous=signal.SIG_DFL):
+    _sizes.clear()
+    if callable(previous):
+        previous(signum, frame)
+
+
+def _watch_resizes() -> bool:
+    """Whether the size is forgotten when the terminal is resized
+
+    A handler for SIGWINCH is set once, if we can be told of resizes
+        and the size is only trusted while that handler is still set
+    """
+    sigwinch = getattr(signal, "SIGWINCH", None)
+    if not sigwinch:
+        return False
+    if not _handlers:
+        if threading.current_thread() is not threading.main_thread():
+            return False
+        previous = signal.getsignal(sigwinch)
+        handler = lambda signum, frame: _resized(signum, frame, previous)
+        signal.signal(sigwinch, handler)
+        _handlers.append(handler)
+    return signal.getsignal(sigwinch) is _handlers[0]
+
+
+def _term() -> str:
+    try:
+        return os.environ["TERM"]
+    except KeyError:
+        raise NoTerminalAvailable("No value for $TERM")
+
+
+def _setupterm(term: str) -> bool:
+    """Whether curses is set up for that term
+
+    curses can only be set up once in a process, for the first term asked
+    """
+    if not _setup_terms:
+        if sys.__stdout__ is None:
+            return False
+        try:
+            import curses
+
+            curses.setupterm(term, sys.__stdout__.fileno())
+        except (ImportError, AttributeError, OSError, ValueError):
+            return False
+        except Exception as e:  # curses.error
+            raise NoTerminalAvailable(str(e))
+        _setup_terms.append(term)
+    return _setup_terms[0] == term
+
+
+def _tput(term: str, name: str) -> bytes:
+    """Ask tput, for terms which curses cannot be set up for"""
+    result = subprocess.run(
+        ["tput", "-T", term, name], capture_output=True, stdin=subprocess.DEVNULL
+    )
+    if result.returncode == 3:  # unknown terminal
+        raise NoTerminalAvailable(result.stderr.decode(errors="replace"))
+    return b"" if result.returncode else result.stdout
+
+
+def capability(name: str, term: str = "") -> bytes:
+    """The terminfo string for that capability, for that (or this) $TERM
+
+    Gives b"" if the terminal does not have that capability
+    """
+    term = term or _term()
+    try:
+        return _capabilities[term, name]
+    except KeyError:
+        pass
+    if _setupterm(term):
+        import curses
+
+        value = curses.tigetstr(name) or b""
+    else:
+        value = _tput(term, name)
+    _capabilities[term, name] = value
+    return value
+
+
+def _terminal_size() -> os.terminal_size:
+    for stream in (sys.__stdout__, sys.__stderr__, sys.__stdin__):
+        if stream is None:
+            continue
+        try:
+            return os.get_terminal_size(stream.fileno())
+        except (AttributeError, ValueError, OSError):
+            continue
+    term = _term()
+    if _setupterm(term):
+        import curses
+
+        columns, lines = curses.tigetnum("cols"), curses.tigetnum("lines")
+        if columns > 0 and lines > 0:
+            return os.terminal_size((columns, lines))
+    return os.terminal_size((80, 24))
+
+
+def terminal_size() -> os.terminal_size:
+    """Size of the terminal, from $COLUMNS and $LINES if set
+
+    Raises NoTerminalAvailable if there is no terminal, nor $TERM
+    """
+    watching = _watch_resizes()
+    if not (_sizes and watching):
+        _sizes[:] = [_terminal_size()]
+    columns, lines = _sizes[0]
+    try:
+        columns = int(os.environ["COLUMNS"]) or columns
+    except (KeyError, ValueError):
+        pass
     try:
-        return int(output) - 1
-    except TypeError:
-        return 0
+        lines = int(os.environ["LINES"]) or lines
+    except (KeyError, ValueError):
+        pass
+    return os.terminal_size((columns, lines))
 
 
-def screen_width():
-    return _tput("cols")
+def screen_width() -> int:
+    """Columns which can be written to without wrapping"""
+    return terminal_size().columns - 1
 
 
-def screen_height():
-    return _tput("lines")
+def screen_height() -> int:
+    """Lines which can be written to without scrolling"""
+    return terminal_size().lines - 1
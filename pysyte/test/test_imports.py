@@ -0,0 +1,57 @@
+"""Test that importing pysyte's modules does not load heavy dependencies
+
+Each module is imported in a new python, with "-X importtime"
+    which lists every module loaded, and how long each took
+"""
+
+import subprocess
+import sys
+import unittest
+from typing import Dict
+
+heavy = {"deprecated", "rich.console", "rich.traceback", "stackprinter", "yamlreader"}
+
+
+def import_times(module: str) -> Dict[str, int]:
+    """Cumulative microseconds to import each module loaded by that one"""
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    process = subprocess.run(command, capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            continue  # the header line
+    return times
+
+
+class TestImports(unittest.TestCase):
+    def assert_light(self, module: str, *also: str):
+        times = import_times(module)
+        self.assertIn(module, times)
+        loaded = (heavy | set(also)) & set(times)
+        self.assertFalse(loaded, f"importing {module} loaded {sorted(loaded)}")
+
+    def test_cli_lines(self):
+        """Scripts handling lines do not need paths, configs or rich"""
+        self.assert_light("pysyte.cli.lines", "path", "pysyte.types.paths")
+
+    def test_cli_arguments(self):
+        self.assert_light("pysyte.cli.arguments", "path")
+
+    def test_cli_exceptions(self):
+        """rich is only loaded when there is an exception to show"""
+        self.assert_light("pysyte.cli.exceptions")
+
+    def test_cli_streams(self):
+        self.assert_light("pysyte.cli.streams", "six")
+
+    def test_types_paths(self):
+        """deprecated is only loaded when a deprecated method is called"""
+        self.assert_light("pysyte.types.paths")
+
+    def test_colours(self):
+        self.assert_light("pysyte.colours.texts", "pysyte.types.paths")
@@ -2,6 +2,7 @@
 
 
 import unittest
+from unittest.mock import patch
 
 
 from pysyte import term
@@ -23,3 +24,40 @@ class TestTerm(unittest.TestCase):
             return
         self.assertIsInstance(width, int)
         self.assertGreater(width, 10)
+
+    def test_cached(self):
+        """The size is kept, until the terminal is resized"""
+        try:
+            term.terminal_size()
+        except term.NoTerminalAvailable:
+            return
+        if not term._watch_resizes():
+            return
+        term._sizes[:] = [term.os.terminal_size((100, 50))]
+        self.assertEqual(term.screen_width(), 99)
+        term.os.kill(term.os.getpid(), term.signal.SIGWINCH)
+        self.assertNotEqual(term._sizes, [(100, 50)])
+
+    def test_handler_replaced(self):
+        """The size is not kept if another SIGWINCH handler replaces ours"""
+        if not term._watch_resizes():
+            return
+        size = term.os.terminal_size((120, 40))
+        term._sizes[:] = [term.os.terminal_size((100, 50))]
+        previous = term.signal.signal(term.signal.SIGWINCH, lambda *_: None)
+        try:
+            with patch.object(term, "_terminal_size", return_value=size):
+                term.terminal_size()
+            self.assertEqual(term._sizes, [size])
+        finally:
+            term.signal.signal(term.signal.SIGWINCH, previous)
+
+    def test_capability(self):
+        """Capabilities are looked up once per TERM"""
+        try:
+            smcup = term.capability("smcup", "xterm")
+        except term.NoTerminalAvailable:
+            return
+        self.assertTrue(smcup.startswith(b"\x1b"))
+        self.assertIs(term.capability("smcup", "xterm"), smcup)
+        self.assertEqual(term.capability("not_a_capability", "xterm"), b"")
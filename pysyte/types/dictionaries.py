@@ -4,7 +4,9 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
-from yamlreader import data_merge
+from pysyte.lazy import lazy_import
+
+yamlreader = lazy_import("yamlreader")
 
 
 def get_caselessly(dictionary, sought):
@@ -123,7 +125,7 @@ class NameSpace(dict):
         self.__dict__ = self
 
     def update(self, other):
-        self.__dict__ = data_merge(self.__dict__, other)
+        self.__dict__ = yamlreader.data_merge(self.__dict__, other)
 
 
 class NameSpaces(NameSpace):
@@ -0,0 +1,252 @@
+"""Keep an index of directory listings on disk
+
+Tools which list the same directories on every run can ask an index instead
+    The index is an sqlite file, under $XDG_CACHE_HOME/pysyte by default
+    Each directory is stored with its mtime
+        and is only listed again when that mtime changes
+
+Answers are the same as from the live filesystem:
+    entries cannot be added, removed or renamed without changing the mtime
+    symlinks are stored as links, so their targets are checked live
+    a directory changed too recently to trust its mtime is listed again
+"""
+
+import os
+import sqlite3
+import stat as stat_
+import time
+from fnmatch import fnmatch
+from glob import has_magic
+from typing import Callable
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from pysyte.oss import linux
+from pysyte.types import paths
+from pysyte.types import stats
+from pysyte.types import walks
+
+Entry = Tuple[str, str]  # name, kind
+
+# mtimes closer than this to the time of listing may hide a later change
+RACY_NS = 2_000_000_000
+
+_schema = """
+CREATE TABLE IF NOT EXISTS directories (
+    path TEXT PRIMARY KEY,
+    mtime INTEGER NOT NULL,
+    listed INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    directory TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    PRIMARY KEY (directory, position)
+);
+"""
+
+
+def default_path_to_index() -> str:
+    """Where indexes are kept, unless told otherwise"""
+    return os.path.join(linux.xdg_cache_dir(), "pysyte", "directories.sqlite")
+
+
+def _kind(entry: os.DirEntry) -> str:
+    """A letter for the kind of entry: "d"irectory, "f"ile, "l"ink or "o"ther"""
+    try:
+        if entry.is_symlink():
+            return "l"
+        if entry.is_dir():
+            return "d"
+        if entry.is_file():
+            return "f"
+    except OSError:
+        pass
+    return "o"
+
+
+class DirectoryIndex:
+    """An index of listings for directories under a root
+
+    >>> index = DirectoryIndex('/usr', ':memory:')
+    >>> assert index.contains_directory('/usr', 'lib*')
+    >>> assert index.list_sub_directories('/usr', 'bin') == ['/usr/bin']
+    """
+
+    def __init__(self, root, path_to_index: Optional[str] = None):
+        self.root = paths.makepath(os.path.abspath(str(root)))
+        self.path_to_index = path_to_index or default_path_to_index()
+        if self.path_to_index != ":memory:":
+            os.makedirs(os.path.dirname(self.path_to_index), exist_ok=True)
+        self.connection = sqlite3.connect(self.path_to_index)
+        self.connection.executescript(_schema)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {str(self.root)!r}>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def _stored(self, directory: str, mtime: int) -> Optional[List[Entry]]:
+        """The stored entries for that directory, if they are still good"""
+        row = self.connection.execute(
+            "SELECT mtime, listed FROM directories WHERE path = ?", (directory,)
+        ).fetchone()
+        if not row:
+            return None
+        stored_mtime, listed = row
+        if stored_mtime != mtime or listed - mtime < RACY_NS:
+            return None
+        rows = self.connection.execute(
+            "SELECT name, kind FROM entries WHERE directory = ? ORDER BY position",
+            (directory,),
+        )
+        return list(rows)
+
+    def _store(self, directory: str, mtime: int, entries: List[Entry]) -> None:
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM entries WHERE directory = ?", (directory,)
+            )
+            self.connection.execute(
+                "INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                (directory, mtime, time.time_ns()),
+            )
+            self.connection.executemany(
+                "INSERT INTO entries VALUES (?, ?, ?, ?)",
+                [(directory, i, name, kind) for i, (name, kind) in enumerate(entries)],
+            )
+
+    def listing(self, directory) -> List[Entry]:
+        """Names and kinds of all entries in that directory
+
+        Only list the directory if it has changed since last stored
+        An empty list if that is not a directory
+        """
+        directory_ = os.path.abspath(str(directory))
+        try:
+            mtime = os.stat(directory_).st_mtime_ns
+        except OSError:
+            return []
+        return self._listing(directory_, mtime)
+
+    def _listing(self, directory: str, mtime: int) -> List[Entry]:
+        entries = self._stored(directory, mtime)
+        if entries is None:
+            scanned = walks.scan(directory, "ignore")
+            entries = [(_.name, _kind(_)) for _ in scanned]
+            self._store(directory, mtime, entries)
+        return entries
+
+    def update(self) -> int:
+        """Bring the index up to date for all directories under root
+
+        Symlinked directories are followed, but no directory is checked twice
+            so a link back up the tree does not loop
+        Gives the number of directories checked
+        """
+        checked = 0
+        seen: Set[Tuple[int, int]] = set()
+        directories = [str(self.root)]
+        while directories:
+            directory = directories.pop()
+            try:
+                stat = os.stat(directory)
+            except OSError:
+                continue
+            if not stat_.S_ISDIR(stat.st_mode) or (stat.st_dev, stat.st_ino) in seen:
+                continue
+            seen.add((stat.st_dev, stat.st_ino))
+            checked += 1
+            for name, kind in self._listing(directory, stat.st_mtime_ns):
+                if kind in ("d", "l"):
+                    directories.append(os.path.join(directory, name))
+        return checked
+
+    def _path(self, directory: str, name: str, kind: str) -> paths.StringPath:
+        """A path to that entry, typed without a stat where possible"""
+        path_ = os.path.join(directory, name)
+        if kind == "f":
+            return paths.FilePath(path_)
+        if kind == "d":
+            return paths.DirectPath(path_)
+        return paths.makepath(path_)
+
+    def _is_dir(self, directory: str, name: str, kind: str) -> bool:
+        if kind == "l":
+            return stats.isdir(os.path.join(directory, name))
+        return kind == "d"
+
+    def _is_file(self, directory: str, name: str, kind: str) -> bool:
+        if kind == "l":
+            return stats.isfile(os.path.join(directory, name))
+        return kind == "f"
+
+    def _matching(
+        self, directory, glob: str, wanted: Callable[[str, str, str], bool]
+    ) -> List[paths.StringPath]:
+        directory_ = str(paths.makepath(directory))
+        return [
+            self._path(directory_, name, kind)
+            for name, kind in self.listing(directory_)
+            if fnmatch(name, glob) and wanted(directory_, name, kind)
+        ]
+
+    def list_items(
+        self, directory, glob: str, wanted: Optional[Callable] = None
+    ) -> List[paths.StringPath]:
+        """As paths.list_items(), from the index"""
+        items = self._matching(directory, glob, lambda *_: True)
+        return [_ for _ in items if wanted(_)] if wanted else items
+
+    def list_sub_directories(self, directory, glob: str) -> List[paths.StringPath]:
+        """As paths.list_sub_directories(), from the index"""
+        return self._matching(directory, glob, self._is_dir)
+
+    def list_files(self, directory, glob: str) -> List[paths.StringPath]:
+        """All files in that directory matching that glob"""
+        return self._matching(directory, glob, self._is_file)
+
+    def contains_directory(self, directory, glob: str) -> bool:
+        """As paths.contains_directory(), from the index"""
+        return any(self.list_sub_directories(directory, glob))
+
+    def contains_file(self, directory, glob: str) -> bool:
+        """As paths.contains_file(), from the index"""
+        return any(self.list_files(directory, glob))
+
+    def glob(self, pattern: str) -> List[paths.StringPath]:
+        """As glob.glob() for that pattern, relative to root, from the index
+
+        As for glob.glob(), "*" does not match names starting with "."
+        """
+        parts = [_ for _ in pattern.split(os.path.sep) if _]
+        if not parts:
+            return []
+        found: List[Tuple[str, str, str]] = [("", str(self.root), "d")]
+        for i, part in enumerate(parts):
+            last = i == len(parts) - 1
+            matched = []
+            for directory, name, _ in found:
+                path_ = os.path.join(directory, name) if name else directory
+                for child, child_kind in self.listing(path_):
+                    if has_magic(part):
+                        if child.startswith(".") and not part.startswith("."):
+                            continue
+                        if not fnmatch(child, part):
+                            continue
+                    elif child != part:
+                        continue
+                    if last or self._is_dir(path_, child, child_kind):
+                        matched.append((path_, child, child_kind))
+            found = matched
+        return [self._path(*_) for _ in found]
@@ -1,5 +1,19 @@
 """Methods for handling lines (of text)"""
+import itertools
 import re
+from collections import deque
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Pattern
+from typing import Sequence
+from typing import Tuple
+from typing import Union
+
+Numbered = Iterator[Tuple[int, str]]  # (index, line) pairs
+Boundary = Union[int, Pattern]
+Span = Tuple[int, int]  # (start, end) of a match in a line
+Regexp = Union[str, Pattern]
 
 
 def _chop(lines_in, at, first, last):
@@ -49,6 +63,107 @@ def chop(text, at, first=1, last=-1):
     return _chop(text.splitlines() or [], at, first, last)
 
 
+def _boundary(value) -> Boundary:
+    """A number, or a regexp, from that value
+
+    >>> assert _boundary("-2") == -2
+    >>> assert _boundary("fred").search("alfred")
+    """
+    if not value:
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return re.compile(value)
+
+
+def _from_end(numbered: Numbered, count: int) -> Numbered:
+    """The last count of those lines, keeping no more than that"""
+    return iter(deque(numbered, maxlen=count))
+
+
+def _all_but_last(numbered: Numbered, count: int) -> Numbered:
+    """All but the last count of those lines, keeping no more than that"""
+    held: deque = deque()
+    for item in numbered:
+        held.append(item)
+        if len(held) > count:
+            yield held.popleft()
+
+
+def _starting(numbered: Numbered, first: Boundary) -> Numbered:
+    """Lines from the first boundary on"""
+    if isinstance(first, int):
+        if first > 0:
+            return itertools.islice(numbered, first - 1, None)
+        if first < 0:
+            return _from_end(numbered, -first)
+        return numbered
+    return itertools.dropwhile(lambda x: not first.search(x[1]), numbered)
+
+
+def _until(numbered: Numbered, last: Boundary) -> Numbered:
+    """Lines up to, and including, the last boundary
+
+    Nothing is read after the last line
+    """
+    if isinstance(last, int) and last < -1:
+        yield from _all_but_last(numbered, -last - 1)
+        return
+    for i, line in numbered:
+        if isinstance(last, int):
+            if 0 < last <= i:
+                return
+            yield i, line
+            if i + 1 == last:
+                return
+        else:
+            yield i, line
+            if last.search(line):
+                return
+
+
+def chop_numbered(lines: Iterable[str], at=None, first=1, last=-1) -> Numbered:
+    """Those lines which fit those boundaries, with their (0-based) indexes
+
+    lines can be any iterable of lines, such as an open file
+        which is read in one forward pass, and no further than needed
+    Boundaries are line numbers (from 1, or from -1 at the end) or regexps
+        At most the number of lines counted from the end are held in memory
+
+    >>> lines = ['one', 'two', 'three', 'four']
+    >>> assert list(chop_numbered(lines, at=-2)) == [(2, 'three')]
+    >>> assert list(chop_numbered(lines, first='t', last=-2)) == [
+    ...     (1, 'two'), (2, 'three')
+    ... ]
+    """
+    numbered = enumerate(_.rstrip("\r\n") for _ in lines)
+    if not at:
+        return _until(_starting(numbered, _boundary(first)), _boundary(last))
+    at_ = _boundary(at)
+    if isinstance(at_, int) and at_ > 0:
+        return itertools.islice(numbered, at_ - 1, at_)
+    return itertools.islice(_starting(numbered, at_), 1)
+
+
+def chop_stream(lines: Iterable[str], at=None, first=1, last=-1):
+    """As chop(), but for any iterable of lines, such as an open file
+
+    Gives the index of the first line, and an iterator over the chopped lines
+
+    >>> lines = ['one', 'two', 'three', 'four']
+    >>> first, chopped = chop_stream(iter(lines), '[t][w][o]')
+    >>> assert first == 1 and list(chopped) == ['two']
+    """
+    numbered = chop_numbered(lines, at, first, last)
+    try:
+        start, line = next(numbered)
+    except StopIteration:
+        return 0, iter([])
+    rest = (line_ for _, line_ in numbered)
+    return start, itertools.chain([line], rest)
+
+
 def set_width(line, width):
     if not width:
         return line
@@ -66,24 +181,56 @@ def _number_format(count=999):
     return "%%%dd: " % digits
 
 
-def add_numbers(lines, first=0):
-    def numbered(line_, line_format_):
-        prefix = line_format_ % (first + i + 1)
-        return f"{prefix}{line_.rstrip()}"
+def _counted(lines, first=0):
+    """Those lines, and the number of the last one
 
-    for i, line in enumerate(lines):
-        yield numbered(line, _number_format(len(lines) + first))
+    Sized lines are not read, other iterables are read once to count them
+        and an iterator is kept in a list, so it can be read again
+    """
+    try:
+        return lines, len(lines) + first
+    except TypeError:
+        pass
+    if iter(lines) is lines:
+        lines = list(lines)
+        return lines, len(lines) + first
+    return lines, sum(1 for _ in lines) + first
 
 
-def sed(lines, args):
-    return reformat_lines(
-        lines, first=args.first, numbers=args.numbers, width=args.width
-    )
+def number_lines(lines, first=0, count=None):
+    """Prefix each line with its number, counting from first + 1
+
+    count is the highest number to expect, which sets the width of all numbers
+        if not given then the lines are counted first
+
+    >>> assert list(number_lines(iter(['one', 'two']), 8)) == [' 9: one', '10: two']
+    >>> assert next(number_lines(iter(['one', 'two']), 8, count=999)) == '  9: one'
+    """
+    if count is None:
+        lines, count = _counted(lines, first)
+    line_format = f"{_number_format(count)}%s"
+    return (line_format % (i, _.rstrip()) for i, _ in enumerate(lines, first + 1))
 
 
-def reformat_lines(lines, first, numbers, width):
-    adder = add_numbers if numbers else lambda x, y: x
-    return list(adder([_[:width] if width else _ for _ in lines], first))
+def add_numbers(lines, first=0, count=None):
+    yield from number_lines(lines, first, count)
+
+
+def sed(lines, args, start=None):
+    first = args.first if start is None else start
+    return reformat_lines(lines, first=first, numbers=args.numbers, width=args.width)
+
+
+def reformatted_lines(lines, first=0, numbers=False, width=0, count=None):
+    """Lines cut to that width, and numbered, as they are read"""
+    if numbers and count is None:
+        lines, count = _counted(lines, first)
+    cut = (_[:width] for _ in lines) if width else lines
+    return number_lines(cut, first, count) if numbers else cut
+
+
+def reformat_lines(lines, first, numbers, width, count=None):
+    return list(reformatted_lines(lines, first, numbers, width, count))
 
 
 def select(predicate, lines):
@@ -93,20 +240,143 @@ def select(predicate, lines):
         yield line
 
 
+_magic = re.compile(r"[.^$*+?{}\[\]\\|()]")
+
+
+def is_literal(pattern: Regexp) -> bool:
+    """Whether that pattern has no special characters for a regexp
+
+    >>> assert is_literal('fred') and not is_literal('fred.*')
+    >>> assert not is_literal(re.compile('fred'))
+    """
+    return isinstance(pattern, str) and not _magic.search(pattern)
+
+
+# Backreferences, named groups and inline flags can't be joined with "|"
+_unjoinable = re.compile(r"\\[1-9]|\(\?(?![:=!]|<[=!])")
+
+
+def _joinable(pattern: Regexp) -> bool:
+    return isinstance(pattern, str) and not _unjoinable.search(pattern)
+
+
+def _compiled(patterns: Sequence[Regexp], flags: int) -> List[Pattern]:
+    """Regexps to match any of those patterns
+
+    Those which can be are joined into one, the rest are compiled alone
+        and any which are already compiled are used as they are
+    """
+    joinable = [_ for _ in patterns if _joinable(_)]
+    alone = [
+        _ if isinstance(_, re.Pattern) else re.compile(_, flags)
+        for _ in patterns
+        if not _joinable(_)
+    ]
+    if not joinable:
+        return alone
+    return [re.compile("|".join(f"(?:{_})" for _ in joinable), flags)] + alone
+
+
+def _merged(spans: List[Span]) -> List[Span]:
+    """Those spans, sorted, with any overlaps joined"""
+    result: List[Span] = []
+    for start, end in sorted(spans):
+        if result and start <= result[-1][1]:
+            result[-1] = result[-1][0], max(end, result[-1][1])
+        else:
+            result.append((start, end))
+    return result
+
+
+class Grep:
+    """Select lines matching any include, and no exclude, patterns
+
+    Patterns are compiled once, regexps into as few as can be
+        and plain strings are found with str.find()
+
+    >>> grep = Grep(['fred', 'f.d'], ['^#'])
+    >>> assert list(grep(['fred', 'fud', '# fred', 'mary'])) == ['fred', 'fud']
+    >>> assert grep.spans('a fred, a fid') == [(2, 6), (10, 13)]
+    """
+
+    def __init__(
+        self, includes: Sequence[Regexp] = (), excludes: Sequence[Regexp] = (), flags=0
+    ):
+        self.includes = list(includes)
+        self.excludes = list(excludes)
+        literal = lambda x: not flags and is_literal(x)
+        self._literals = [_ for _ in self.includes if isinstance(_, str) and literal(_)]
+        self._included = _compiled([_ for _ in self.includes if not literal(_)], flags)
+        self._excluded_literals = [
+            _ for _ in self.excludes if isinstance(_, str) and literal(_)
+        ]
+        self._excluded = _compiled([_ for _ in self.excludes if not literal(_)], flags)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.includes!r}, {self.excludes!r}>"
+
+    def __call__(self, lines: Iterable[str]) -> Iterator[str]:
+        return (_ for _ in lines if self.matches(_))
+
+    def included(self, line: str) -> bool:
+        """Whether that line matches any include (or there are none)"""
+        if not self.includes:
+            return True
+        if any(_ in line for _ in self._literals):
+            return True
+        return any(_.search(line) for _ in self._included)
+
+    def excluded(self, line: str) -> bool:
+        """Whether that line matches any exclude"""
+        if any(_ in line for _ in self._excluded_literals):
+            return True
+        return any(_.search(line) for _ in self._excluded)
+
+    def matches(self, line: str) -> bool:
+        return self.included(line) and not self.excluded(line)
+
+    def spans(self, line: str) -> List[Span]:
+        """Where includes match in that line, for highlighting"""
+        spans = []
+        for literal in self._literals:
+            start = line.find(literal)
+            while start >= 0 and literal:
+                spans.append((start, start + len(literal)))
+                start = line.find(literal, start + len(literal))
+        for regexp in self._included:
+            spans.extend(_.span() for _ in regexp.finditer(line))
+        return _merged([_ for _ in spans if _[0] < _[1]])
+
+    def search(self, lines: Iterable[str]) -> Iterator[Tuple[int, str, List[Span]]]:
+        """Index, line, and spans of matches for each selected line"""
+        for i, line in enumerate(lines):
+            if self.matches(line):
+                yield i, line, self.spans(line)
+
+
 _selector = lambda method, lines_: (_ for _ in lines_ if method(_))
 _converter = lambda method, lines_: (method(_) for _ in lines_)
 
 full = lambda lines_: _converter(
     lambda line: line.rstrip(), _selector(lambda line: line.rstrip(), lines_)
 )
-grep = lambda lines_: lambda regexp: _selector(
-    lambda line: line and re.search(regexp, line), lines_
-)
+
+
+def grep(lines_):
+    def grepper(regexp):
+        matches = Grep([regexp]).matches
+        return _selector(lambda line: line and matches(line), lines_)
+
+    return grepper
 
 
 def arg_lines(text, args):
     return chop(text, args.at, args.first, args.last)
 
 
+def arg_stream_lines(stream, args):
+    return chop_stream(stream, args.at, args.first, args.last)
+
+
 def as_text(lines):
     return "\n".join(lines)
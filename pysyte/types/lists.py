@@ -1,15 +1,19 @@
 """This module handles lists"""
 
 import itertools
+import operator
 
 from typing import Any
 from typing import Callable
+from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import SupportsIndex
 from typing import Tuple
 from typing import TypeVar
 
 Unique = TypeVar("Unique")  # Generic type
+Self = TypeVar("Self", bound="Uniques")
 
 
 class Nones(list):
@@ -57,16 +61,46 @@ class Lots(Many):
 
 
 # https://stackoverflow.com/a/25464724/500942
-class Uniques(list):
+class Uniques(List[Unique]):
     """A list of unique items
 
     Uniqueness is checked when appending to the list
+        against an index of the items, kept in step with the list
+    Items which cannot be hashed are kept aside, and checked one by one
     """
 
     def __init__(self, items=None):
         super().__init__([])
+        self._index: Dict[Any, int] = {}
+        self._unhashables: List[Any] = []
         self.extend(items or [])
 
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def _add(self, item: Unique) -> None:
+        try:
+            self._index[item] = self._index.get(item, 0) + 1
+        except TypeError:
+            self._unhashables.append(item)
+
+    def _discard(self, item: Unique) -> None:
+        try:
+            count = self._index.pop(item)
+        except TypeError:
+            self._unhashables.remove(item)
+            return
+        if count > 1:
+            self._index[item] = count - 1
+
+    def __contains__(self, item) -> bool:
+        try:
+            if item in self._index:
+                return True
+        except TypeError:
+            return super().__contains__(item)
+        return any(item == _ for _ in self._unhashables)
+
     def predicate(self, _: Unique) -> bool:
         """Subclasses can exclude items which return False"""
         return True
@@ -74,17 +108,68 @@ class Uniques(list):
     def convert(self, item: Unique) -> Unique:
         return item
 
+    def _accepted(self, item: Unique) -> bool:
+        return item not in self and self.predicate(item)
+
     def append(self, item: Unique) -> None:
-        if item in self:
+        if not self._accepted(item):
             return
-        if not self.predicate(item):
-            return
-        super().append(self.convert(item))
+        converted = self.convert(item)
+        super().append(converted)
+        self._add(converted)
 
     def extend(self, items: Iterable[Unique]) -> None:
         for item in items or []:
             self.append(item)
 
+    def __iadd__(  # type: ignore[override, misc]
+        self: Self, items: Iterable[Unique]
+    ) -> Self:
+        self.extend(items)
+        return self
+
+    def __imul__(self: Self, count: SupportsIndex) -> Self:
+        if operator.index(count) < 1:
+            self.clear()
+        return self
+
+    def insert(self, index: SupportsIndex, item: Unique) -> None:
+        if not self._accepted(item):
+            return
+        converted = self.convert(item)
+        super().insert(index, converted)
+        self._add(converted)
+
+    def remove(self, item: Unique) -> None:
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, index: SupportsIndex = -1) -> Unique:
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._index.clear()
+        self._unhashables.clear()
+
+    def __setitem__(self, index, value) -> None:
+        old = self[index]
+        if isinstance(index, slice):
+            value = list(value)
+        super().__setitem__(index, value)
+        for item in old if isinstance(index, slice) else [old]:
+            self._discard(item)
+        for item in value if isinstance(index, slice) else [value]:
+            self._add(item)
+
+    def __delitem__(self, index) -> None:
+        old = self[index]
+        super().__delitem__(index)
+        for item in old if isinstance(index, slice) else [old]:
+            self._discard(item)
+
 
 class UniquelyTrues(Uniques):
     """A unique list of items all being true-ish"""
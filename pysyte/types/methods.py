@@ -1,8 +1,19 @@
 import inspect
+import sys
+import time
+from collections import OrderedDict
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
+from dataclasses import replace
+from functools import cached_property
+from threading import RLock
+from typing import Any
 from typing import Callable
+from typing import Deque
+from typing import Hashable
 from typing import Optional
+from typing import Tuple
 from types import FrameType
 from types import ModuleType
 
@@ -17,38 +28,69 @@ class MethodData:
     method: Callable
 
 
+@dataclass(frozen=True)
+class Caller:
+    """Where a method was called from
+
+    Only a summary is kept, not the frame, so the caller's locals can be freed
+    """
+
+    filename: str
+    lineno: int
+    function: str
+
+    @classmethod
+    def from_frame(cls, frame: Optional[FrameType]) -> Optional["Caller"]:
+        if frame is None:
+            return None
+        code = frame.f_code
+        return cls(code.co_filename, frame.f_lineno, code.co_name)
+
+
 class Method(MethodData):
-    """A callable method with some convenience attributes"""
+    """A callable method with some convenience attributes
 
-    def __init__(self, method: Callable):
+    Callers are only recorded if asked for, up to that many of the latest
+        >>> method = Method(lambda x: x + 1, callers=2)
+        >>> assert method(1) == 2 and method.caller.function == '<module>'
+    """
+
+    def __init__(self, method: Callable, callers: int = 0):
         super().__init__(unwrap(method))
         if self.method != method:
             self.wrapped = method
         self.code = self.method.__code__
-        self.init_frame = inspect.currentframe()
-        self.callers = [self.init_frame.f_back]
+        self.callers: Deque[Caller] = deque(maxlen=max(callers, 0))
+        self.recording = callers > 0
+        if self.recording:
+            self._record(sys._getframe(1))
+
+    def _record(self, frame: Optional[FrameType]) -> None:
+        caller_ = Caller.from_frame(frame)
+        if caller_:
+            self.callers.append(caller_)
 
     def run(self, *args, **kwargs):
         return self.method(*args, **kwargs)
 
     def __call__(self, *args, **kwargs):
-        call_frame = inspect.currentframe()
-        self.callers.append(call_frame.f_back)
+        if self.recording:
+            self._record(sys._getframe(1))
         return self.method(*args, **kwargs)
 
     @property
-    def caller(self) -> Optional[FrameType]:
-        return self.callers[-1]
+    def caller(self) -> Optional[Caller]:
+        return self.callers[-1] if self.callers else None
 
     @property
     def filename(self) -> str:
         return self.code.co_filename
 
-    @property
+    @cached_property
     def module(self) -> Optional[ModuleType]:
         return inspect.getmodule(self.method)
 
-    @property
+    @cached_property
     def doc(self) -> str:
         return inspect.getdoc(self.method) or ""
 
@@ -80,7 +122,98 @@ def _represent_args(*args, **kwargs):
     return ", ".join(argument_strings + keyword_strings)
 
 
-def memoized(method):
+MAXSIZE = 1024
+
+
+@dataclass
+class MemoStatistics:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+def _key(args, kwargs) -> Hashable:
+    """A key for those arguments: hashed if possible, else their repr()
+
+    Types are in the key, so that (1) and (True) are kept apart, as by repr()
+    >>> assert _key((1,), {}) != _key((True,), {})
+    >>> assert _key(([1],), {}) == ('[1]',)
+    """
+    values = args + tuple(kwargs.values())
+    key = (args, tuple(kwargs.items()), tuple(type(_) for _ in values))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return (_represent_args(*args, **kwargs),)
+
+
+class Memo:
+    """A cache of results, keyed on arguments
+
+    At most maxsize results are kept, the least recently used are evicted
+        (None for no limit)
+    Results older than ttl seconds are not used (None to keep them)
+    """
+
+    def __init__(self, maxsize: Optional[int] = MAXSIZE, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.results: OrderedDict = OrderedDict()
+        self.statistics = MemoStatistics()
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.results
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Whether that key is cached, and its result"""
+        with self._lock:
+            try:
+                when, result = self.results[key]
+            except KeyError:
+                self.statistics.misses += 1
+                return False, None
+            if self.ttl is not None and time.monotonic() - when >= self.ttl:
+                del self.results[key]
+                self.statistics.evictions += 1
+                self.statistics.misses += 1
+                return False, None
+            self.results.move_to_end(key)
+            self.statistics.hits += 1
+            return True, result
+
+    def put(self, key: Hashable, result: Any) -> None:
+        with self._lock:
+            self.results[key] = time.monotonic(), result
+            self.results.move_to_end(key)
+            while self.maxsize is not None and len(self.results) > self.maxsize:
+                self.results.popitem(last=False)
+                self.statistics.evictions += 1
+
+    def remove(self, key: Hashable) -> None:
+        with self._lock:
+            del self.results[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.results.clear()
+
+    def info(self) -> MemoStatistics:
+        """Counts of hits, misses and evictions so far, and the current size"""
+        with self._lock:
+            return replace(self.statistics, size=len(self.results))
+
+
+def memoized(
+    method: Optional[Callable] = None,
+    maxsize: Optional[int] = MAXSIZE,
+    ttl: Optional[float] = None,
+):
     """A new method which acts like the given method but memoizeds args
 
     See https://en.wikipedia.org/wiki/Memoization for the general idea
@@ -107,31 +240,65 @@ def memoized(method):
         >>> test(2)
         called
         3
+
+    And a method "statistics", to see how well the cache is doing
+        >>> assert test.statistics().hits == 2
+
+    The cache can be limited in size, or in time, as a decorator with arguments
+        >>> @memoized(maxsize=100, ttl=60)
+        ... def test(arg):
+        ...     return arg + 1
+        ...
+
+    Coroutines are memoized with the results they await
     """
-    method.cache = {}
+    if method is None:
+        return lambda method_: memoized(method_, maxsize, ttl)
+    cache = Memo(maxsize, ttl)
 
     def invalidate(*args, **kwargs):
-        key = _represent_args(*args, **kwargs)
-        if not key:
-            method.cache = {}
-        elif key in method.cache:
-            del method.cache[key]
-        else:
+        if not args and not kwargs:
+            cache.clear()
+            return
+        try:
+            cache.remove(_key(args, kwargs))
+        except KeyError:
+            key = _represent_args(*args, **kwargs)
             raise KeyError(f"Not prevously cached: {method.__name__}({key})")
 
-    def new_method(*args, **kwargs):
-        """Cache the args and return values of the call
+    if inspect.iscoroutinefunction(method):
+
+        async def awaiting(*args, **kwargs):
+            key = _key(args, kwargs)
+            found, result = cache.get(key)
+            if not found:
+                result = await method(*args, **kwargs)
+                cache.put(key, result)
+            return result
+
+        new_method: Any = awaiting
+    else:
+
+        def calling(*args, **kwargs):
+            """Cache the args and return values of the call
+
+            The key cached is the args themselves, if they can be hashed
+                otherwise the repr() of args
+                This allows more types of values to be used as keys to the cache
+                Such as lists and tuples
+            """
+            key = _key(args, kwargs)
+            found, result = cache.get(key)
+            if not found:
+                result = method(*args, **kwargs)
+                cache.put(key, result)
+            return result
 
-        The key cached is the repr() of args
-            This allows more types of values to be used as keys to the cache
-            Such as lists and tuples
-        """
-        key = _represent_args(*args, **kwargs)
-        if key not in method.cache:
-            method.cache[key] = method(*args, **kwargs)
-        return method.cache[key]
+        new_method = calling
 
+    new_method.cache = cache
     new_method.invalidate = invalidate
+    new_method.statistics = cache.info
     new_method.__doc__ = method.__doc__
     new_method.__name__ = f"memoized({method.__name__})"
     return new_method
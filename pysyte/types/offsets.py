@@ -0,0 +1,261 @@
+"""Find lines in a file by their offsets, without reading the rest of it
+
+The file is memory-mapped, and the start of each line is found once
+    by searching for newlines, which is as fast as memchr()
+Those offsets are kept in a cache file, keyed by the file's size and mtime
+    so later runs can go straight to any line, or to the tail
+    but only for big files, and only for the most recently used of those
+
+    >>> with LineOffsets(__file__, cache=False) as offsets:
+    ...     assert 'memory-mapped' in offsets.line(3)
+    ...     assert offsets.line(-1) == offsets.lines(len(offsets))[0]
+"""
+
+import hashlib
+import mmap
+import os
+import stat as stat_
+import struct
+from array import array
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from pysyte.oss import linux
+
+_header = struct.Struct("=8sQqQ")  # magic, size, mtime_ns, number of lines
+_magic = b"pysyteLO"
+
+ENCODING, ERRORS = "utf-8", "replace"  # for files' lines, however they are read
+CACHE_SIZE = 1 << 24  # smaller files are searched again rather than cached
+MAX_CACHED = 64  # offsets files kept in the default cache
+
+
+def default_path_to_cache(path_: str) -> str:
+    """Where offsets for that file are kept, unless told otherwise"""
+    key = hashlib.sha1(os.path.realpath(path_).encode()).hexdigest()
+    return os.path.join(linux.xdg_cache_dir(), "pysyte", "offsets", f"{key}.offsets")
+
+
+def prune(directory: str, keep: int = MAX_CACHED) -> None:
+    """Remove all but the keep most recently used offsets files in that dir"""
+    try:
+        entries = [_ for _ in os.scandir(directory) if _.name.endswith(".offsets")]
+    except OSError:
+        return
+    if len(entries) <= keep:
+        return
+
+    def used(entry: os.DirEntry) -> float:
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    for entry in sorted(entries, key=used, reverse=True)[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def _map(stream) -> Optional[mmap.mmap]:
+    """A read-only map of that stream, None if it is empty"""
+    try:
+        return mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return None
+
+
+def find_offsets(data) -> array:
+    """Offsets of the start of each line in those bytes
+
+    >>> assert list(find_offsets(b'one\\ntwo\\n\\nfour')) == [0, 4, 8, 9]
+    """
+    offsets = array("Q")
+    size = len(data)
+    start = 0
+    while start < size:
+        offsets.append(start)
+        newline = data.find(b"\n", start)
+        if newline < 0:
+            break
+        start = newline + 1
+    return offsets
+
+
+class LineOffsets:
+    """The offsets of all lines in a file
+
+    Lines are numbered from 1, or from -1 at the end, as for chop()
+    Only the lines asked for are decoded
+
+    If cache is a path then offsets are kept there, if False they are not kept
+        otherwise they are kept in the default cache, which is pruned
+    """
+
+    def __init__(self, path_, cache=None, encoding=ENCODING, errors=ERRORS):
+        self.path = str(path_)
+        self.encoding = encoding
+        self.errors = errors
+        self._stream = open(self.path, "rb")
+        stat = os.fstat(self._stream.fileno())
+        self._key = stat.st_size, stat.st_mtime_ns
+        self._data = _map(self._stream)
+        self._cached: Optional[mmap.mmap] = None
+        self._default_cache = cache is None
+        if cache is False:
+            self.path_to_cache = ""
+        else:
+            self.path_to_cache = cache or default_path_to_cache(self.path)
+        self.offsets = self._load() or self._build()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.path!r}, {len(self)} lines>"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def close(self) -> None:
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+        self.offsets = array("Q")
+        for opened in (self._cached, self._data, self._stream):
+            if opened is not None:
+                opened.close()
+        self._cached = self._data = None
+
+    def _load(self):
+        """Offsets from the cache, if it was made for this size and mtime"""
+        if not self.path_to_cache:
+            return None
+        try:
+            with open(self.path_to_cache, "rb") as stream:
+                cached = _map(stream)
+        except OSError:
+            return None
+        if cached is None or len(cached) < _header.size:
+            return None
+        magic, size, mtime, count = _header.unpack_from(cached)
+        expected = _header.size + count * 8
+        if magic != _magic or (size, mtime) != self._key or len(cached) != expected:
+            cached.close()
+            return None
+        self._cached = cached
+        try:
+            os.utime(self.path_to_cache)  # recently used, so not pruned
+        except OSError:
+            pass
+        return memoryview(cached)[_header.size :].cast("Q")
+
+    def _build(self) -> array:
+        offsets = find_offsets(self._data) if self._data is not None else array("Q")
+        if self.path_to_cache:
+            self._save(offsets)
+        return offsets
+
+    def _save(self, offsets: array) -> None:
+        """Keep those offsets in the cache, if it can be written"""
+        header = _header.pack(_magic, *self._key, len(offsets))
+        temporary = f"{self.path_to_cache}.{os.getpid()}"
+        try:
+            os.makedirs(os.path.dirname(self.path_to_cache), exist_ok=True)
+            with open(temporary, "wb") as stream:
+                stream.write(header)
+                offsets.tofile(stream)
+            os.replace(temporary, self.path_to_cache)
+        except OSError:
+            return
+        if self._default_cache:
+            prune(os.path.dirname(self.path_to_cache))
+
+    def _index(self, number: int) -> int:
+        """The index of that line number, counting back from the end if < 0"""
+        return number - 1 if number > 0 else max(len(self) + number, 0)
+
+    def _decode(self, start: int, end: int) -> List[str]:
+        if start >= end:
+            return []
+        last = self.offsets[end] if end < len(self) else len(self._data)
+        text = self._data[self.offsets[start] : last].decode(self.encoding, self.errors)
+        return [_.rstrip("\r") for _ in text.split("\n")][: end - start]
+
+    def line(self, number: int) -> str:
+        """That line, without its newline
+
+        Raises IndexError if there is no such line
+        """
+        if not number or abs(number) > len(self):
+            raise IndexError(f"{self.path} has no line {number}")
+        index = self._index(number)
+        return self._decode(index, index + 1)[0]
+
+    def lines(self, first: int = 1, last: int = -1) -> List[str]:
+        """Lines from first to last (inclusive), without newlines"""
+        return self.chop(None, first, last)[1]
+
+    def tail(self, count: int) -> List[str]:
+        """The last count of lines"""
+        return self.lines(-count) if count > 0 else []
+
+    def window(self, at: int = 0, first: int = 1, last: int = -1) -> Tuple[int, int]:
+        """Indexes (from, to) of the lines chosen, as by lines.chop_numbered()"""
+        if at:
+            index = self._index(at)
+            return index, min(index + 1, len(self))
+        start = self._index(first) if first else 0
+        if last > 0:
+            end = min(last, len(self))
+        elif last < -1:
+            end = len(self) + last + 1
+        else:
+            end = len(self)
+        return start, end
+
+    def chop(self, at=None, first=1, last=-1) -> Tuple[int, List[str]]:
+        """As lines.chop_stream(), for numbered boundaries only"""
+        start, end = self.window(int(at or 0), int(first or 0), int(last or 0))
+        chopped = self._decode(start, end)
+        return (start if chopped else 0), chopped
+
+
+def is_numbered(*boundaries) -> bool:
+    """Whether all those boundaries are line numbers (rather than regexps)
+
+    >>> assert is_numbered(0, '-20', None)
+    >>> assert not is_numbered(1, 'fred')
+    """
+    for boundary in boundaries:
+        try:
+            int(boundary or 0)
+        except ValueError:
+            return False
+    return True
+
+
+def arg_file_lines(
+    path_, args, cache: Optional[bool] = None
+) -> Optional[Tuple[int, List[str]]]:
+    """Chop the lines of that file from its offsets, if args allow
+
+    None if that is not a regular file, or if args have any regexp boundaries
+    Offsets are cached if asked, or by default for files of CACHE_SIZE or more
+    """
+    if not is_numbered(args.at, args.first, args.last):
+        return None
+    try:
+        stat = os.stat(str(path_))
+    except (OSError, ValueError):
+        return None
+    if not stat_.S_ISREG(stat.st_mode):
+        return None
+    if cache is None:
+        cache = stat.st_size >= CACHE_SIZE
+    with LineOffsets(path_, cache=None if cache else False) as offsets:
+        return offsets.chop(args.at, args.first, args.last)
@@ -10,21 +10,33 @@ import stat
 import sys
 from dataclasses import dataclass
 from fnmatch import fnmatch
+from fnmatch import translate
 from functools import singledispatch
+from functools import wraps
 from importlib import import_module
+from typing import Dict
 from typing import Iterable
 from typing import List
+from typing import Optional
+from typing import Pattern
 from typing import Sequence
 from typing import Tuple
 from typing import Union
 
-from deprecated import deprecated
 
 from path import Path as path_Path
+from pysyte.lazy import lazy_decorator
+from pysyte.types import stats
+from pysyte.types import walks
 from pysyte.types.lists import flatten
 from pysyte.types.methods import Method
 
 
+def deprecated(**kwargs):
+    """As deprecated.deprecated(), importing that when first called"""
+    return lazy_decorator("deprecated", "deprecated", extra_stacklevel=1, **kwargs)
+
+
 class PathError(Exception):
     """Something went wrong with a path"""
 
@@ -239,11 +251,49 @@ class StringPath(path_Path):
         ext_ = ext.lstrip(".")
         return makepath(f'{filename}.{ext_}')
 
-    def has_vcs_dir(self):
-        for vcs_dir in (".git", ".svn", ".hg"):
-            if self.fnmatch_part(vcs_dir):
-                return True
-        return False
+    def exists(self) -> bool:
+        return stats.exists(self)
+
+    def isdir(self) -> bool:
+        return stats.isdir(self)
+
+    def isfile(self) -> bool:
+        return stats.isfile(self)
+
+    def has_vcs_dir(self, vcs_dirs=None):
+        """Whether any part of this path is a VCS directory (.git, ...)
+
+        Other globs, or an IgnoreMatcher, can be given as vcs_dirs
+        """
+        matcher = ignore_fnmatches(vcs_dirs) if vcs_dirs else _vcs_dirs
+        return matcher(self)
+
+
+def _invalidating(method):
+    """That method, after which all cached stats are forgotten"""
+
+    @wraps(method)
+    def invalidating(*args, **kwargs):
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.invalidate()
+
+    return invalidating
+
+
+# Methods of path.Path which change the filesystem, so cached stats of any path
+_mutators = """
+    chmod copy copy2 copyfile copytree link makedirs makedirs_p merge_tree
+    mkdir mkdir_p move remove remove_p removedirs removedirs_p rename renames
+    replace rmdir rmdir_p rmtree rmtree_p symlink touch unlink unlink_p utime
+    write_bytes write_lines write_text
+""".split()
+
+for _mutator in _mutators:
+    if hasattr(path_Path, _mutator):
+        setattr(StringPath, _mutator, _invalidating(getattr(path_Path, _mutator)))
+del _mutator
 
 
 def ext_language(ext, exts=None, simple=True):
@@ -320,6 +370,7 @@ class NonePath(StringPath):
 
     def makedirs(self):
         os.makedirs(str(self))
+        stats.invalidate()
 
 
 class DotPath(StringPath):
@@ -523,10 +574,7 @@ class DotPath(StringPath):
     def has_executable(self):
         """Whether the path has any executable bits set"""
         executable_bits = stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH
-        try:
-            return bool(os.stat(self).st_mode & executable_bits)
-        except OSError:
-            return False
+        return bool(stats.mode(self) & executable_bits)
 
 
 class FilePath(DotPath, PathAssertions):
@@ -684,7 +732,7 @@ class DirectPath(DotPath, PathAssertions):
         Including any sub-directories and their contents"""
         for child in self.walkfiles():
             child.remove()
-        for child in reversed([self.walkdirs()]):
+        for child in reversed(list(self.walkdirs())):
             if child == self or not child.isdir():
                 continue
             child.rmdir()
@@ -724,23 +772,78 @@ class DirectPath(DotPath, PathAssertions):
         paths_to_subs = [self / _ for _ in sub_paths]
         return [_ for _ in paths_to_subs if _.exists()]
 
+    def _walk_ignorer(self, ignores):
+        """A method to ignore walked entries, by their path relative to self"""
+        if not ignores:
+            return None
+        matcher = ignore_fnmatches(ignores)
+
+        def ignorer(entry, _relative):
+            """Directories above the entry were not ignored, else not walked
+
+            So only the entry's own name needs matching
+            """
+            return matcher.name_ignored(entry.name, walks.is_dir(entry, "ignore"))
+
+        return ignorer
+
+    def _walk(self, errors, ignores, workers, ordered, max_queue):
+        """Entries under this directory
+
+        If workers is given then use that many threads
+            and give entries in sorted order, or as they arrive
+        """
+        ignorer = self._walk_ignorer(ignores)
+        if not workers:
+            return walks.walk(self, errors, ignorer)
+        return walks.walk_parallel(self, errors, ignorer, workers, ordered, max_queue)
+
     # pylint: disable=arguments-differ
-    def walkdirs(self, pattern=None, errors="strict", ignores=None):
-        ignored = ignore_fnmatches(ignores)
-        for path_to_dir in super(DirectPath, self).walkdirs(pattern, errors):
-            if not ignored(path_to_dir.relpath(self)):
-                yield path_to_dir
+    def walkdirs(
+        self,
+        pattern=None,
+        errors="strict",
+        ignores=None,
+        workers=None,
+        ordered=False,
+        max_queue=walks.MAX_QUEUE,
+    ):
+        """Walk sub-directories, recursively
+
+        Ignored directories are not entered
+        With workers, sub-directories are listed in parallel
+        """
+        for entry in self._walk(errors, ignores, workers, ordered, max_queue):
+            if not walks.is_dir(entry, errors):
+                continue
+            if pattern is None or fnmatch(entry.name, pattern):
+                yield self.__class__(entry.path)
 
     # pylint: disable=arguments-differ
-    def walkfiles(self, pattern=None, errors="strict", ignores=None):
-        ignored = ignore_fnmatches(ignores)
-        for path_to_file in super(DirectPath, self).walkfiles(pattern, errors):
-            if not ignored(path_to_file.relpath(self)):
-                yield path_to_file
+    def walkfiles(
+        self,
+        pattern=None,
+        errors="strict",
+        ignores=None,
+        workers=None,
+        ordered=False,
+        max_queue=walks.MAX_QUEUE,
+    ):
+        """Walk files in this directory and sub-directories
+
+        Ignored directories are not entered
+        With workers, sub-directories are listed in parallel
+        """
+        for entry in self._walk(errors, ignores, workers, ordered, max_queue):
+            if not walks.is_file(entry, errors):
+                continue
+            if pattern is None or fnmatch(entry.name, pattern):
+                yield self.__file_class__(entry.path)
 
     def listfiles(self, pattern=None, ignores=None):
         ignored = ignore_fnmatches(ignores)
-        return [_ for _ in self.listdir(pattern) if _.isfile() and not ignored(_)]
+        items = self.listdir(pattern)
+        return [_ for _ in items if _.isfile() and not ignored(_, is_dir=False)]
 
     def isroot(self):
         return str(self) == "/"
@@ -786,16 +889,92 @@ class FileTypes(FileTypesData):
                 yield typed
 
 
-def ignore_fnmatches(ignores):
-    def ignored(a_path):
-        if not ignores:
+def _compile_globs(globs: Iterable[str]) -> Optional[Pattern]:
+    """One regexp to match any of those globs, None if there are none"""
+    regexps = [f"(?:{translate(_)})" for _ in globs if _]
+    return re.compile("|".join(regexps)) if regexps else None
+
+
+class IgnoreMatcher:
+    """Match paths against many ignore globs at once
+
+    The globs are compiled into one regexp for names
+        and another for directories (ignoring any "/" at either end)
+    A path is ignored if its name matches
+        or any of its directories does, as for DotPath.fnmatch_part()
+
+    >>> ignored = IgnoreMatcher(["*.pyc", "/.tox/"])
+    >>> assert ignored("lib/fred.pyc", is_dir=False)
+    >>> assert ignored(".tox/lib/fred.py", is_dir=False)
+    >>> assert not ignored("lib/fred.py", is_dir=False)
+    """
+
+    def __init__(self, globs: Iterable[str]):
+        self.globs = list(globs)
+        sep = os.path.sep
+        self.names = _compile_globs(_.lstrip(sep) for _ in self.globs)
+        self.directories = _compile_globs(_.strip(sep) for _ in self.globs)
+        self._ignored_directories: Dict[str, bool] = {}
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.globs!r}>"
+
+    def __bool__(self):
+        return bool(self.globs)
+
+    def __call__(self, path_, is_dir: Optional[bool] = None) -> bool:
+        return self.ignored(path_, is_dir)
+
+    def name_ignored(self, name: str, is_dir: bool) -> bool:
+        """Whether that name matches, without looking at any directories"""
+        if self.names and self.names.match(name):
+            return True
+        return bool(is_dir and self.directories and self.directories.match(name))
+
+    def directory_ignored(self, directory: str) -> bool:
+        """Whether any part of that directory matches
+
+        Results are cached for each directory, so parents are matched once
+        """
+        try:
+            return self._ignored_directories[directory]
+        except KeyError:
+            pass
+        parent, name = os.path.split(directory)
+        result = bool(name and self.directories and self.directories.match(name))
+        if not result and parent and parent != directory:
+            result = self.directory_ignored(parent)
+        self._ignored_directories[directory] = result
+        return result
+
+    def ignored(self, path_, is_dir: Optional[bool] = None) -> bool:
+        """Whether that path should be ignored
+
+        If is_dir is not given then the path is checked on disk
+        """
+        if not self.globs:
             return False
-        for ignore in ignores:
-            if a_path.fnmatch_part(ignore):
-                return True
-        return False
+        string = str(path_)
+        if len(string) > 1:
+            string = string.rstrip(os.path.sep)
+        is_dir_ = stats.isdir(string) if is_dir is None else is_dir
+        parent, name = os.path.split(string)
+        if self.name_ignored(name, is_dir_):
+            return True
+        return bool(parent) and self.directory_ignored(parent)
+
+
+def ignore_fnmatches(ignores) -> IgnoreMatcher:
+    """A matcher for those ignore globs
+
+    If ignores is already a matcher, use that
+    """
+    if isinstance(ignores, IgnoreMatcher):
+        return ignores
+    return IgnoreMatcher(ignores or [])
+
 
-    return ignored
+_vcs_dirs = IgnoreMatcher([".git", ".svn", ".hg"])
 
 
 class ChmodValues:
@@ -854,16 +1033,17 @@ def ____mp(arg) -> StringPath:
     """
     if not arg:
         return makepath(None)
-    if os.path.isfile(arg):
+    kind = stats.kind(arg)
+    if kind == "file":
         return FilePath(arg)
-    if os.path.isdir(arg):
+    if kind == "dir":
         string = arg if arg == "/" else arg.rstrip("/")
         return DirectPath(string)
     v = os.path.expandvars(arg)
     u = os.path.expanduser(v)
     if arg == u:
         return NonePath(arg)
-    if os.path.exists(u):
+    if stats.exists(u):
         return makepath(u)
     return NonePath(arg)
 
@@ -920,7 +1100,7 @@ def makestr(string: str) -> StringPath:
 
 def pathstr(string: str) -> StringPath:
     """Make a path from a string"""
-    if os.path.isfile(string) or os.path.isdir(string):
+    if stats.kind(string) in ("file", "dir"):
         return makepath(string)
     return NonePath(string)
 
@@ -1147,7 +1327,7 @@ def add_stars(strings):
     return [add_star(p) for p in paths_]
 
 
-def tab_complete(strings, globber=add_stars, select=os.path.exists):
+def tab_complete(strings, globber=add_stars, select=os.path.exists, index=None):
     """Finish path names "left short" by bash's tab-completion
 
     strings is a string or strings
@@ -1160,6 +1340,8 @@ def tab_complete(strings, globber=add_stars, select=os.path.exists):
 
     select is a method to choose wanted paths
         Defaults to selecting existing paths
+
+    index is an optional indexes.DirectoryIndex to list directories
     """
     strings_ = [strings] if isinstance(strings, str) else strings
     globs = flatten([globber(s) for s in strings_])
@@ -1172,7 +1354,10 @@ def tab_complete(strings, globber=add_stars, select=os.path.exists):
         else:
             dir_ = here_
             base = glob_
-        match = [p for p in dir_.listdir() if p.fnmatch_basename(base)]
+        if index:
+            match = index.list_items(dir_, base.lstrip(os.path.sep))
+        else:
+            match = [p for p in dir_.listdir() if p.fnmatch_basename(base)]
         matches.extend(match)
     result = [p for p in set(matches) if select(p)]
     return result if result[1:] else strings
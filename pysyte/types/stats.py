@@ -0,0 +1,188 @@
+"""Cache the results of os.stat() for paths
+
+Making a path, then asking it isdir() or isfile(), costs a stat each time
+    Within a cached_stats() block each path is stat'd once
+    and all paths share those results
+
+    >>> with cached_stats() as cache:
+    ...     assert isdir('/usr') and not isfile('/usr')
+    ...
+    >>> assert '/usr' in cache and len(cache) == 1
+
+Changes to the filesystem are not seen inside the block
+    unless the cache is invalidated, or its ttl (in seconds) has passed
+"""
+
+import os
+import stat as stat_
+import time
+from contextlib import contextmanager
+from threading import RLock
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+Stat = Union[os.stat_result, os.DirEntry]
+
+
+def _os_stat(path_: str) -> Optional[os.stat_result]:
+    """The os.stat() of that path, or None if it cannot be stat'd"""
+    try:
+        return os.stat(path_)
+    except (OSError, ValueError):
+        return None
+
+
+class StatCache:
+    """Remember the stat of each path for ttl seconds (or forever)
+
+    Values are either an os.stat_result,
+        or an os.DirEntry remembered from a directory scan
+        or None for a missing path
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        self.ttl = ttl
+        self._stats: Dict[str, Tuple[float, Optional[Stat]]] = {}
+        self._lock = RLock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self)} paths, ttl={self.ttl}>"
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def __contains__(self, path_) -> bool:
+        return str(path_) in self._stats
+
+    def _fresh(self, when: float) -> bool:
+        return self.ttl is None or time.monotonic() - when < self.ttl
+
+    def stat(self, path_) -> Optional[Stat]:
+        """The (cached) stat of that path, None if the path is missing"""
+        key = str(path_)
+        with self._lock:
+            try:
+                when, value = self._stats[key]
+                if self._fresh(when):
+                    return value
+            except KeyError:
+                pass
+            value = _os_stat(key)
+            self._stats[key] = time.monotonic(), value
+            return value
+
+    def remember(self, entry: os.DirEntry) -> None:
+        """Keep that entry (from os.scandir()) as the stat for its path"""
+        with self._lock:
+            self._stats[entry.path] = time.monotonic(), entry
+
+    def invalidate(self, path_=None) -> None:
+        """Forget that path, or all paths if none is given"""
+        with self._lock:
+            if path_ is None:
+                self._stats.clear()
+            else:
+                self._stats.pop(str(path_), None)
+
+
+_caches: List[StatCache] = []
+
+
+def active() -> Optional[StatCache]:
+    """The innermost cache in use, if any"""
+    return _caches[-1] if _caches else None
+
+
+@contextmanager
+def cached_stats(
+    ttl: Optional[float] = None, cache: Optional[StatCache] = None
+) -> Iterator[StatCache]:
+    """Use a cache of stats for all paths within the block
+
+    A cache can be re-used across blocks by passing it in
+    """
+    cache_ = StatCache(ttl) if cache is None else cache
+    _caches.append(cache_)
+    try:
+        yield cache_
+    finally:
+        _caches.remove(cache_)
+
+
+def stat(path_) -> Optional[Stat]:
+    """The stat of that path, from the active cache if there is one"""
+    cache = active()
+    if cache is not None:
+        return cache.stat(path_)
+    return _os_stat(str(path_))
+
+
+def remember(entry: os.DirEntry) -> None:
+    """Add that scanned entry to the active cache, if there is one"""
+    cache = active()
+    if cache is not None:
+        cache.remember(entry)
+
+
+def invalidate(path_=None) -> None:
+    """Forget that path (or all paths) in all active caches"""
+    for cache in _caches:
+        cache.invalidate(path_)
+
+
+def _stat_result(value: Stat) -> os.stat_result:
+    """The os.stat_result of that value, stat'ing a DirEntry if need be"""
+    return value.stat() if isinstance(value, os.DirEntry) else value
+
+
+def mode(path_) -> int:
+    """The st_mode of that path, 0 if it is missing"""
+    value = stat(path_)
+    if value is None:
+        return 0
+    try:
+        return _stat_result(value).st_mode
+    except OSError:
+        return 0
+
+
+def kind(path_) -> str:
+    """Whether that path is a "file", a "dir", some "other" thing, or ""
+
+    >>> assert kind('/usr') == 'dir'
+    >>> assert kind(__file__) == 'file'
+    >>> assert kind('/not/a/path') == ''
+    """
+    value = stat(path_)
+    if value is None:
+        return ""
+    if isinstance(value, os.DirEntry):
+        try:
+            if value.is_file():
+                return "file"
+            if value.is_dir():
+                return "dir"
+            value = value.stat()
+        except OSError:
+            return ""
+    if stat_.S_ISREG(value.st_mode):
+        return "file"
+    if stat_.S_ISDIR(value.st_mode):
+        return "dir"
+    return "other"
+
+
+def exists(path_) -> bool:
+    return bool(kind(path_))
+
+
+def isdir(path_) -> bool:
+    return kind(path_) == "dir"
+
+
+def isfile(path_) -> bool:
+    return kind(path_) == "file"
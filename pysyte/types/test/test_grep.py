@@ -0,0 +1,56 @@
+"""Test the Grep class of the lines module"""
+
+import re
+from unittest import TestCase
+
+from pysyte.types import lines
+
+
+class TestGrep(TestCase):
+    def test_grep(self):
+        """Grep() keeps lines with any include, and without any exclude"""
+        text = "one,two,three,four,five,six,seven,eight,nine,ten,eleven"
+        lines_ = text.split(",")
+        grep = lines.Grep(["o", "^t"], ["w", "e$"])
+        actual = list(grep(lines_))
+        expected = ["four", "ten"]
+        self.assertEqual(actual, expected)
+
+    def test_grep_spans(self):
+        """Grep() gives where any includes match, with overlaps joined"""
+        grep = lines.Grep(["ee", "e+n", "[0-9]"])
+        actual = grep.spans("seventeen 17")
+        expected = [(3, 5), (6, 9), (10, 12)]
+        self.assertEqual(actual, expected)
+        self.assertEqual(lines.Grep().spans("seventeen"), [])
+
+    def test_grep_inline_flags(self):
+        """Patterns with inline flags are not joined to others"""
+        grep = lines.Grep(["f.d", "(?i)FRED"])
+        actual = list(grep(["FrEd", "fud", "mary"]))
+        expected = ["FrEd", "fud"]
+        self.assertEqual(actual, expected)
+
+    def test_grep_backreferences(self):
+        """Patterns with backreferences keep their own groups"""
+        grep = lines.Grep(["(a)\\1", "(b)\\1"])
+        actual = list(grep(["aa", "bb", "ab"]))
+        expected = ["aa", "bb"]
+        self.assertEqual(actual, expected)
+        self.assertEqual(grep.spans("xaabb"), [(1, 5)])
+
+    def test_grep_named_groups(self):
+        """Patterns may use the same group names"""
+        grep = lines.Grep(["(?P<x>a)b", "(?P<x>c)d"], ["(?P<x>e)"])
+        actual = list(grep(["ab", "cd", "cde"]))
+        expected = ["ab", "cd"]
+        self.assertEqual(actual, expected)
+
+    def test_grep_compiled(self):
+        """Compiled patterns are used as they are"""
+        grep = lines.Grep([re.compile("F..D", re.IGNORECASE), "mary"])
+        actual = list(grep(["fred", "mary", "john"]))
+        expected = ["fred", "mary"]
+        self.assertEqual(actual, expected)
+        grepper = lines.grep(["fred", "john"])
+        self.assertEqual(list(grepper(re.compile("^j"))), ["john"])
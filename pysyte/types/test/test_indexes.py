@@ -0,0 +1,86 @@
+"""Test the indexes module"""
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from pysyte.types import indexes
+from pysyte.types import paths
+
+
+class TestDirectoryIndex(TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.root = self.temp.name
+        for name in ("src/one.py", "src/two.txt", "bin/run", ".hidden/three.py"):
+            path = os.path.join(self.root, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+        os.symlink(os.path.join(self.root, "src"), os.path.join(self.root, "link"))
+        self.cache = tempfile.TemporaryDirectory()
+        path_to_index = os.path.join(self.cache.name, "index.sqlite")
+        self.index = indexes.DirectoryIndex(self.root, path_to_index)
+
+    def tearDown(self):
+        self.index.close()
+        self.cache.cleanup()
+        self.temp.cleanup()
+
+    def test_same_as_live(self):
+        """The index gives the same answers as the filesystem"""
+        for glob in ("*", "s*", ".*", "l*"):
+            expected = paths.list_items(self.root, glob)
+            self.assertEqual(self.index.list_items(self.root, glob), expected)
+            expected = paths.list_sub_directories(self.root, glob)
+            actual = self.index.list_sub_directories(self.root, glob)
+            self.assertEqual(actual, expected)
+        src = os.path.join(self.root, "src")
+        self.assertTrue(self.index.contains_file(src, "*.py"))
+        self.assertFalse(self.index.contains_file(src, "*.pyc"))
+
+    def test_glob(self):
+        """glob() matches glob.glob()"""
+        path = paths.makepath(self.root)
+        for pattern in ("*/*.py", "*", ".*/*", "src/two.txt", "link/*", "*/nope"):
+            expected = sorted(path.glob(pattern))
+            self.assertEqual(sorted(self.index.glob(pattern)), expected, pattern)
+
+    def test_unchanged_directories_are_not_listed(self):
+        """Directories are listed again only if changed
+
+        Recent changes are not trusted, so make them all look old
+        """
+        self.assertEqual(self.index.update(), 4)
+        for directory in ("", "src", "bin", ".hidden"):
+            os.utime(os.path.join(self.root, directory), ns=(0, 0))
+        self.index.update()
+        os.utime(os.path.join(self.root, "bin"), ns=(0, 1))
+        with patch("pysyte.types.walks.os.scandir", wraps=os.scandir) as scandir:
+            self.index.update()
+        scanned = [str(_.args[0]) for _ in scandir.call_args_list]
+        self.assertEqual(scanned, [os.path.join(self.root, "bin")])
+
+    def test_changed_directories_are_listed(self):
+        self.assertFalse(self.index.list_items(self.root, "new*"))
+        open(os.path.join(self.root, "new.txt"), "w").close()
+        self.assertTrue(self.index.list_items(self.root, "new*"))
+
+    def test_symlink_loops(self):
+        """Links back up the tree are not followed round and round"""
+        os.symlink(self.root, os.path.join(self.root, "src", "up"))
+        self.assertEqual(self.index.update(), 4)
+
+    def test_relative_root(self):
+        """Directories are kept by their absolute paths"""
+        cwd = os.getcwd()
+        os.chdir(self.root)
+        try:
+            path_to_index = os.path.join(self.cache.name, "relative.sqlite")
+            with indexes.DirectoryIndex("src", path_to_index) as index:
+                self.assertEqual(str(index.root), os.path.join(self.root, "src"))
+                index.update()
+                rows = index.connection.execute("SELECT path FROM directories")
+                self.assertEqual([_ for _, in rows], [str(index.root)])
+        finally:
+            os.chdir(cwd)
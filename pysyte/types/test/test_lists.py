@@ -102,6 +102,45 @@ class TestUniques(TestCase):
         actual = list(uniques)
         self.assertEqual(actual, expected)
 
+    def test_unhashable(self):
+        """Items which cannot be hashed are still unique"""
+        expected = [[1], {2: 3}, 4]
+        uniques = lists.Uniques([[1], {2: 3}, [1], 4, {2: 3}])
+        actual = list(uniques)
+        self.assertEqual(actual, expected)
+        self.assertIn([1], uniques)
+        self.assertNotIn([2], uniques)
+
+    def test_inserting(self):
+        """Inserted items should be unique too"""
+        expected = [4, 1, 3, 2, 0]
+        uniques = lists.Uniques([1, 1, 3, 1, 2, 3, 0])
+        uniques.insert(0, 4)
+        uniques.insert(0, 3)
+        actual = list(uniques)
+        self.assertEqual(actual, expected)
+
+    def test_removing(self):
+        """Removed items can be added again"""
+        uniques = lists.Uniques([1, 1, 3, 1, 2, 3, 0])
+        uniques.remove(3)
+        self.assertNotIn(3, uniques)
+        self.assertEqual(uniques.pop(), 0)
+        self.assertNotIn(0, uniques)
+        uniques.extend([3, 0])
+        self.assertEqual(list(uniques), [1, 2, 3, 0])
+
+    def test_slicing(self):
+        """Items replaced, or deleted, by slices are no longer in the list"""
+        uniques = lists.Uniques([1, 1, 3, 1, 2, 3, 0])
+        uniques[:2] = [5, 6]
+        self.assertNotIn(1, uniques)
+        self.assertIn(5, uniques)
+        del uniques[-2:]
+        self.assertNotIn(0, uniques)
+        uniques.append(0)
+        self.assertEqual(list(uniques), [5, 6, 0])
+
 
 class TestUniquelyTrues(TestCase):
     def test_uniqueness(self):
@@ -1,8 +1,10 @@
 """Test the methods module"""
 
 
+import asyncio
 from io import StringIO
 import unittest
+from unittest.mock import patch
 
 
 from pysyte.types import methods
@@ -147,3 +149,89 @@ class MemoizeTest(unittest.TestCase):
     def test_full_coverage(self):
         """Some tests needed to get full coverage"""
         self.assertIsNone(method())
+
+
+class MemoLimitsTest(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+    def increment(self, arg):
+        self.calls.append(arg)
+        return arg + 1
+
+    def test_least_recently_used(self):
+        """The least recently used result is evicted when the cache is full"""
+        increment = methods.memoized(self.increment, maxsize=2)
+        increment(1)
+        increment(2)
+        increment(1)
+        increment(3)
+        increment(1)
+        increment(2)
+        self.assertEqual(self.calls, [1, 2, 3, 2])
+        statistics = increment.statistics()
+        self.assertEqual(statistics.hits, 2)
+        self.assertEqual(statistics.misses, 4)
+        self.assertEqual(statistics.evictions, 2)
+        self.assertEqual(statistics.size, 2)
+
+    @patch("pysyte.types.methods.time.monotonic")
+    def test_time_to_live(self, monotonic):
+        """Results are called again after ttl seconds"""
+        monotonic.return_value = 100.0
+        increment = methods.memoized(self.increment, ttl=10)
+        increment(1)
+        monotonic.return_value = 109.0
+        increment(1)
+        monotonic.return_value = 110.0
+        increment(1)
+        self.assertEqual(self.calls, [1, 1])
+
+    def test_same_repr(self):
+        """Arguments with the same repr() are kept apart"""
+
+        class Same(int):
+            def __repr__(self):
+                return "same"
+
+        increment = methods.memoized(self.increment)
+        self.assertEqual(increment(Same(1)), 2)
+        self.assertEqual(increment(Same(2)), 3)
+        self.assertEqual(self.calls, [1, 2])
+
+    def test_coroutine(self):
+        """Coroutines are memoized with their results"""
+
+        async def increment(arg):
+            self.calls.append(arg)
+            return arg + 1
+
+        increment_ = methods.memoized(increment)
+        self.assertEqual(asyncio.run(increment_(1)), 2)
+        self.assertEqual(asyncio.run(increment_(1)), 2)
+        self.assertEqual(self.calls, [1])
+
+
+class MethodTest(unittest.TestCase):
+    def test_no_callers(self):
+        """Callers are not recorded unless asked for"""
+        method_ = methods.Method(average)
+        method_(1, 3, StringIO())
+        self.assertIsNone(method_.caller)
+        self.assertFalse(method_.callers)
+
+    def test_callers(self):
+        """Only the latest callers are recorded, as summaries"""
+        method_ = methods.Method(average, callers=2)
+        for _ in range(3):
+            method_(1, 3, StringIO())
+        self.assertEqual(len(method_.callers), 2)
+        self.assertEqual(method_.caller.function, "test_callers")
+        self.assertEqual(method_.caller.filename, __file__)
+
+    def test_cached_module(self):
+        """The module is only looked up once"""
+        method_ = methods.Method(average)
+        with patch("pysyte.types.methods.inspect.getmodule") as getmodule:
+            self.assertIs(method_.module, method_.module)
+            getmodule.assert_called_once()
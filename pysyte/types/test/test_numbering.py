@@ -0,0 +1,24 @@
+"""Test numbering lines with the lines module"""
+
+from unittest import TestCase
+
+from pysyte.types import lines
+
+
+class TestNumbering(TestCase):
+    def test_add_numbers_to_stream(self):
+        """add_numbers() can number lines as they are read
+
+        Given the highest number to expect, lines are not counted first
+        """
+        lines_ = iter(["one", "two", "three"])
+        numbered = lines.add_numbers(lines_, 8, count=100)
+        self.assertEqual(next(numbered), "  9: one")
+        self.assertEqual(next(lines_), "two")
+
+    def test_add_numbers_to_counted_stream(self):
+        """Without the highest number, add_numbers() counts a stream first"""
+        lines_ = iter(["one", "two", "three"])
+        actual = list(lines.add_numbers(lines_, 8))
+        expected = [" 9: one", "10: two", "11: three"]
+        self.assertEqual(actual, expected)
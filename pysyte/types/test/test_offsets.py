@@ -0,0 +1,79 @@
+"""Test the offsets module"""
+
+import os
+import tempfile
+from argparse import Namespace
+from unittest import TestCase
+from unittest.mock import patch
+
+from pysyte.types import lines
+from pysyte.types import offsets
+
+
+class TestLineOffsets(TestCase):
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp.name, "lines.txt")
+        with open(self.path, "w") as stream:
+            stream.write("".join(f"line {i}\n" for i in range(1, 101)))
+        self.cache = os.path.join(self.temp.name, "lines.offsets")
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def test_lines(self):
+        with offsets.LineOffsets(self.path, self.cache) as offsets_:
+            self.assertEqual(len(offsets_), 100)
+            self.assertEqual(offsets_.line(50), "line 50")
+            self.assertEqual(offsets_.line(-1), "line 100")
+            self.assertEqual(offsets_.lines(10, 12), ["line 10", "line 11", "line 12"])
+            self.assertEqual(offsets_.tail(2), ["line 99", "line 100"])
+            with self.assertRaises(IndexError):
+                offsets_.line(101)
+
+    def test_same_as_chop(self):
+        """Numbered boundaries give the same lines as a streaming chop"""
+        boundaries = [(5, 1, 0), (-3, 1, 0), (0, 10, 20), (0, -20, 0), (0, 95, -3)]
+        with offsets.LineOffsets(self.path, self.cache) as offsets_:
+            for at, first, last in boundaries:
+                with open(self.path) as stream:
+                    start, chopped = lines.chop_stream(stream, at, first, last)
+                    expected = start, list(chopped)
+                self.assertEqual(offsets_.chop(at, first, last), expected)
+
+    def test_cached(self):
+        """Offsets are not found again while the file is unchanged"""
+        offsets.LineOffsets(self.path, self.cache).close()
+        self.assertTrue(os.path.isfile(self.cache))
+        with patch.object(offsets, "find_offsets") as find_offsets:
+            with offsets.LineOffsets(self.path, self.cache) as offsets_:
+                self.assertEqual(offsets_.line(-1), "line 100")
+            find_offsets.assert_not_called()
+
+    def test_changed(self):
+        """Offsets are found again after the file changes"""
+        offsets.LineOffsets(self.path, self.cache).close()
+        with open(self.path, "a") as stream:
+            stream.write("line 101\n")
+        with offsets.LineOffsets(self.path, self.cache) as offsets_:
+            self.assertEqual(offsets_.line(-1), "line 101")
+
+    def test_small_files_not_cached(self):
+        """Small files are chopped from offsets, but those are only kept if asked"""
+        args = Namespace(at=0, first=-2, last=0)
+        with patch.object(offsets, "default_path_to_cache", return_value=self.cache):
+            chopped = offsets.arg_file_lines(self.path, args)
+            self.assertEqual(chopped, (98, ["line 99", "line 100"]))
+            self.assertFalse(os.path.exists(self.cache))
+            offsets.arg_file_lines(self.path, args, cache=True)
+            self.assertTrue(os.path.isfile(self.cache))
+
+    def test_prune(self):
+        """Only the most recently used offsets files are kept"""
+        for i in range(5):
+            path_to_cache = os.path.join(self.temp.name, f"{i}.offsets")
+            open(path_to_cache, "w").close()
+            os.utime(path_to_cache, (i, i))
+        offsets.prune(self.temp.name, keep=2)
+        remaining = sorted(os.listdir(self.temp.name))
+        self.assertEqual(remaining, ["3.offsets", "4.offsets", "lines.txt"])
@@ -3,10 +3,13 @@
 import os
 import random
 import builtins
+import tempfile
 from unittest import TestCase
+from unittest.mock import patch
 
 
 from pysyte.types import paths
+from pysyte.types import stats
 
 
 class SourcePath(paths.FilePath):
@@ -492,3 +495,197 @@ class TestNonePath(TestCase):
     def test_executable(self):
         """A NonePath should not be executable"""
         self.assertFalse(paths.path(None).has_executable())
+
+
+class TestStatCache(TestCase):
+    def setUp(self):
+        self.path_to_test = paths.path(__file__).extend_by("py")
+
+    def test_one_stat_per_path(self):
+        """Within cached_stats() a path is only stat'd once"""
+        with patch("pysyte.types.stats.os.stat", wraps=os.stat) as stat:
+            with stats.cached_stats():
+                path = paths.makepath(str(self.path_to_test))
+                self.assertTrue(path.isfile())
+                self.assertFalse(path.isdir())
+                self.assertTrue(path.exists())
+                path.has_executable()
+        self.assertEqual(stat.call_count, 1)
+
+    def test_types_share_stats(self):
+        """Stats are shared by paths of different classes"""
+        with stats.cached_stats() as cache:
+            file_ = paths.makepath(str(self.path_to_test))
+            self.assertIn(file_, cache)
+            none = paths.NonePath("/not/a/path")
+            self.assertFalse(paths.DirectPath(str(none)).isdir())
+            self.assertIn("/not/a/path", cache)
+        self.assertIsNone(stats.active())
+
+    def test_invalidate(self):
+        """Invalidated paths are stat'd again"""
+        with stats.cached_stats() as cache:
+            self.assertTrue(paths.makepath("/usr").isdir())
+            stats.invalidate("/usr")
+            self.assertNotIn("/usr", cache)
+            self.assertTrue(paths.makepath("/usr").isdir())
+            stats.invalidate()
+            self.assertFalse(len(cache))
+
+    def test_ttl(self):
+        """Stats older than the ttl are stat'd again"""
+        with patch("pysyte.types.stats.os.stat", wraps=os.stat) as stat:
+            with stats.cached_stats(ttl=0):
+                paths.makepath("/usr").isdir()
+        self.assertEqual(stat.call_count, 2)
+
+
+class TestStatCacheChanges(TestCase):
+    """Methods which change the filesystem forget cached stats"""
+
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.root = self.temp.name
+        self.cache = stats.cached_stats()
+        self.cache.__enter__()
+
+    def tearDown(self):
+        self.cache.__exit__(None, None, None)
+        self.temp.cleanup()
+
+    def path(self, name):
+        return paths.makepath(os.path.join(self.root, name))
+
+    def make_file(self, name):
+        path = self.path(name)
+        path.write_text("fred")
+        return self.path(name)
+
+    def test_write(self):
+        self.assertIsInstance(self.path("one"), paths.NonePath)
+        self.make_file("one")
+        self.assertIsInstance(self.path("one"), paths.FilePath)
+
+    def test_touch(self):
+        self.assertFalse(self.path("one").isfile())
+        paths.DirectPath(self.root).touch_file("one")
+        self.assertTrue(self.path("one").isfile())
+
+    def test_remove(self):
+        self.make_file("one").remove()
+        self.assertIsInstance(self.path("one"), paths.NonePath)
+
+    def test_unlink(self):
+        self.make_file("one").unlink()
+        self.assertFalse(self.path("one").isfile())
+
+    def test_rename(self):
+        self.make_file("one").rename(os.path.join(self.root, "two"))
+        self.assertFalse(self.path("one").isfile())
+        self.assertTrue(self.path("two").isfile())
+
+    def test_mkdir(self):
+        self.assertFalse(self.path("sub").isdir())
+        (paths.makepath(self.root) / "sub").mkdir()
+        self.assertIsInstance(self.path("sub"), paths.DirectPath)
+
+    def test_makedirs(self):
+        self.assertFalse(self.path("sub").isdir())
+        self.path("sub/dir").makedirs()
+        self.assertTrue(self.path("sub").isdir())
+        self.assertTrue(self.path("sub/dir").isdir())
+
+    def test_rmtree(self):
+        self.path("sub/dir").makedirs()
+        self.path("sub").rmtree()
+        self.assertFalse(self.path("sub").isdir())
+        self.assertFalse(self.path("sub/dir").isdir())
+
+    def test_remove_dir(self):
+        self.path("sub").makedirs()
+        self.make_file("sub/one")
+        self.assertTrue(self.path("sub").remove_dir())
+        self.assertFalse(self.path("sub/one").isfile())
+        self.assertFalse(self.path("sub").isdir())
+
+
+class TestWalks(TestCase):
+    """Walking a small tree, which has some ignorable directories"""
+
+    def setUp(self):
+        self.temp = tempfile.TemporaryDirectory()
+        self.root = paths.makepath(self.temp.name)
+        for name in ("src/one.py", "src/two.txt", ".tox/lib/three.py", "four.py"):
+            path = os.path.join(self.temp.name, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, "w").close()
+
+    def tearDown(self):
+        self.temp.cleanup()
+
+    def names(self, walked):
+        return sorted(str(_.relpath(self.root)) for _ in walked)
+
+    def test_walkfiles(self):
+        actual = self.names(self.root.walkfiles("*.py"))
+        self.assertEqual(actual, [".tox/lib/three.py", "four.py", "src/one.py"])
+
+    def test_walkfiles_types(self):
+        for walked in self.root.walkfiles():
+            self.assertIsInstance(walked, paths.FilePath)
+        for walked in self.root.walkdirs():
+            self.assertIsInstance(walked, paths.DirectPath)
+
+    def test_walkdirs(self):
+        actual = self.names(self.root.walkdirs())
+        self.assertEqual(actual, [".tox", ".tox/lib", "src"])
+
+    def test_ignored_dirs_are_not_entered(self):
+        with patch("pysyte.types.walks.os.scandir", wraps=os.scandir) as scandir:
+            actual = self.names(self.root.walkfiles(ignores=[".tox"]))
+        self.assertEqual(actual, ["four.py", "src/one.py", "src/two.txt"])
+        scanned = [str(_.args[0]) for _ in scandir.call_args_list]
+        self.assertFalse([_ for _ in scanned if ".tox" in _])
+
+    def test_ignore_matcher(self):
+        """Walks and listings accept a compiled matcher as ignores"""
+        ignores = paths.IgnoreMatcher(["*.txt", "/.tox/"])
+        actual = self.names(self.root.walkfiles(ignores=ignores))
+        self.assertEqual(actual, ["four.py", "src/one.py"])
+        actual = self.names(self.root.walkdirs(ignores=ignores))
+        self.assertEqual(actual, ["src"])
+        src = self.root / "src"
+        self.assertEqual([_.name for _ in src.listfiles(ignores=ignores)], ["one.py"])
+        self.assertTrue((src / "one.py").has_vcs_dir(ignores.globs + ["src"]))
+
+    def test_parallel_walk_ordered(self):
+        """An ordered parallel walk gives same as a sorted walk"""
+        for _ in range(3):
+            actual = [str(_) for _ in self.root.walkfiles(workers=4, ordered=True)]
+            self.assertEqual(actual, sorted(actual))
+            self.assertEqual(len(actual), 4)
+
+    def test_parallel_walk_unordered(self):
+        """An unordered parallel walk gives all items, in any order"""
+        actual = self.names(self.root.walkdirs(workers=4, max_queue=1))
+        self.assertEqual(actual, [".tox", ".tox/lib", "src"])
+        actual = self.names(self.root.walkfiles(workers=2, ignores=[".tox"]))
+        self.assertEqual(actual, ["four.py", "src/one.py", "src/two.txt"])
+
+    def test_parallel_walk_stopped(self):
+        """Leaving a parallel walk early does not wait on full queues"""
+        walked = self.root.walkfiles(workers=2, max_queue=1)
+        self.assertTrue(next(walked))
+        walked.close()
+
+    def test_parallel_walk_errors(self):
+        missing = paths.DirectPath(os.path.join(self.temp.name, "missing"))
+        for ordered in (True, False):
+            walked = missing.walkfiles(workers=2, ordered=ordered)
+            self.assertRaises(OSError, list, walked)
+
+    def test_walk_errors(self):
+        missing = paths.DirectPath(os.path.join(self.temp.name, "missing"))
+        self.assertRaises(OSError, list, missing.walkfiles())
+        self.assertEqual(list(missing.walkfiles(errors="ignore")), [])
+        self.assertRaises(ValueError, list, missing.walkfiles(errors="fred"))
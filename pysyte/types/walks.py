@@ -0,0 +1,253 @@
+"""Walk directory trees with os.scandir()
+
+Each directory is listed once, and the type of each entry
+    comes from that listing (d_type), so no entry needs a stat of its own
+Entries are also remembered in any active stat cache
+    so that paths made from them later do not stat again
+"""
+
+import os
+import queue
+import threading
+import warnings
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from path import TreeWalkWarning
+
+from pysyte.types import stats
+
+Ignorer = Callable[[os.DirEntry, str], bool]
+Listed = Tuple[os.DirEntry, str, bool]  # entry, relative path, is_dir
+
+MAX_QUEUE = 1024
+
+
+def check_errors(errors: str) -> str:
+    """errors should be "strict", "warn" or "ignore", as for path.py's walks"""
+    if errors not in ("strict", "warn", "ignore"):
+        raise ValueError("invalid errors parameter")
+    return errors
+
+
+def handle_error(errors: str, message: str) -> None:
+    """Raise, warn, or ignore the current error"""
+    if errors == "strict":
+        raise
+    if errors == "warn":
+        warnings.warn(message, TreeWalkWarning)
+
+
+def scan(directory: str, errors: str = "strict") -> List[os.DirEntry]:
+    """All entries in that directory
+
+    If the directory cannot be listed then handle that per errors
+        which gives an empty list if not "strict"
+    """
+    try:
+        with os.scandir(directory) as iterator:
+            entries = list(iterator)
+    except OSError as e:
+        handle_error(errors, f"Unable to list directory '{directory}': {e}")
+        return []
+    for entry in entries:
+        stats.remember(entry)
+    return entries
+
+
+def is_dir(entry: os.DirEntry, errors: str = "strict") -> bool:
+    """Whether that entry is a directory (following symlinks)"""
+    try:
+        return entry.is_dir()
+    except OSError as e:
+        handle_error(errors, f"Unable to access '{entry.path}': {e}")
+        return False
+
+
+def is_file(entry: os.DirEntry, errors: str = "strict") -> bool:
+    """Whether that entry is a file (following symlinks)"""
+    try:
+        return entry.is_file()
+    except OSError as e:
+        handle_error(errors, f"Unable to access '{entry.path}': {e}")
+        return False
+
+
+def walk(
+    top: str, errors: str = "strict", ignored: Optional[Ignorer] = None
+) -> Iterator[os.DirEntry]:
+    """All entries under top, depth-first, each directory before its contents
+
+    ignored(entry, relative_path) can exclude entries
+        an ignored directory is not yielded, nor is it entered
+    """
+    check_errors(errors)
+
+    def walk_(directory: str, prefix: str) -> Iterator[os.DirEntry]:
+        for entry in scan(directory, errors):
+            relative = f"{prefix}{entry.name}"
+            if ignored and ignored(entry, relative):
+                continue
+            yield entry
+            if is_dir(entry, errors):
+                yield from walk_(entry.path, f"{relative}{os.path.sep}")
+
+    yield from walk_(str(top), "")
+
+
+def listed(
+    directory: str,
+    prefix: str,
+    errors: str = "strict",
+    ignored: Optional[Ignorer] = None,
+    ordered: bool = False,
+) -> List[Listed]:
+    """Entries in that directory which are not ignored
+
+    Each is given with its relative path (after prefix), and whether it is a dir
+    If ordered then entries are sorted by name
+    """
+    entries = scan(directory, errors)
+    if ordered:
+        entries.sort(key=lambda _: _.name)
+    result = []
+    for entry in entries:
+        relative = f"{prefix}{entry.name}"
+        if ignored and ignored(entry, relative):
+            continue
+        result.append((entry, relative, is_dir(entry, errors)))
+    return result
+
+
+def _ordered_walk(
+    executor: ThreadPoolExecutor,
+    top: str,
+    errors: str,
+    ignored: Optional[Ignorer],
+    max_queue: int,
+) -> Iterator[os.DirEntry]:
+    """Same entries, in same order, as a walk() with sorted directories
+
+    Sub-directories are listed ahead (by the pool) while their parent is yielded
+        with at most max_queue listings waiting at any time
+    """
+    sep = os.path.sep
+    waiting = [0]
+
+    def submit(directory: str, prefix: str) -> Future:
+        return executor.submit(listed, directory, prefix, errors, ignored, True)
+
+    def walk_(future: Future) -> Iterator[os.DirEntry]:
+        listing = future.result()
+        ahead: Dict[str, Future] = {}
+        for entry, relative, is_dir_ in listing:
+            if is_dir_ and waiting[0] < max_queue:
+                ahead[relative] = submit(entry.path, f"{relative}{sep}")
+                waiting[0] += 1
+        for entry, relative, is_dir_ in listing:
+            yield entry
+            if not is_dir_:
+                continue
+            try:
+                sub_future = ahead.pop(relative)
+                waiting[0] -= 1
+            except KeyError:
+                sub_future = submit(entry.path, f"{relative}{sep}")
+            yield from walk_(sub_future)
+
+    yield from walk_(submit(top, ""))
+
+
+def _unordered_walk(
+    executor: ThreadPoolExecutor,
+    top: str,
+    errors: str,
+    ignored: Optional[Ignorer],
+    max_queue: int,
+) -> Iterator[os.DirEntry]:
+    """All entries under top, as soon as any worker has listed them
+
+    At most max_queue entries wait to be yielded, which holds back the workers
+    """
+    sep = os.path.sep
+    results: queue.Queue = queue.Queue(max_queue)
+    stopped = threading.Event()
+    lock = threading.Lock()
+    tasks = [0]
+    done = object()
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def submit(directory: str, prefix: str) -> None:
+        with lock:
+            tasks[0] += 1
+        executor.submit(task, directory, prefix)
+
+    def task(directory: str, prefix: str) -> None:
+        try:
+            listing = listed(directory, prefix, errors, ignored)
+            for entry, relative, is_dir_ in listing:
+                if is_dir_:
+                    submit(entry.path, f"{relative}{sep}")
+            for entry, _, _ in listing:
+                if not put((entry, None)):
+                    return
+        except BaseException as e:  # pylint: disable=broad-except
+            put((None, e))
+        finally:
+            with lock:
+                tasks[0] -= 1
+                finished = not tasks[0]
+            if finished:
+                put((done, None))
+
+    submit(top, "")
+    try:
+        while True:
+            entry, error = results.get()
+            if error:
+                raise error
+            if entry is done:
+                return
+            yield entry
+    finally:
+        stopped.set()
+
+
+def walk_parallel(
+    top: str,
+    errors: str = "strict",
+    ignored: Optional[Ignorer] = None,
+    workers: int = 8,
+    ordered: bool = False,
+    max_queue: int = MAX_QUEUE,
+) -> Iterator[os.DirEntry]:
+    """All entries under top, with directories listed by a pool of threads
+
+    Listing directories on network filesystems, or with cold caches,
+        is mostly waiting, and the pool lets those waits overlap
+
+    If ordered, entries are given as by walk() with each directory sorted
+        otherwise they are given as they arrive
+    max_queue limits how far the workers can get ahead of the caller
+    """
+    check_errors(errors)
+    executor = ThreadPoolExecutor(max(1, workers), thread_name_prefix="walk")
+    walker = _ordered_walk if ordered else _unordered_walk
+    try:
+        yield from walker(executor, str(top), errors, ignored, max(1, max_queue))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)